@@ -0,0 +1,34 @@
+"""Replace affiliate_sales affiliate_id index with covering index
+
+Revision ID: a3f6c81d5e27
+Revises: d91b6c2f47e8
+Create Date: 2026-10-16 22:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f6c81d5e27'
+down_revision: Union[str, None] = 'd91b6c2f47e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_affiliate_sales_affiliate_commission',
+        'affiliate_sales',
+        ['affiliate_id'],
+        unique=False,
+        postgresql_include=['marketing_commission'],
+    )
+    op.drop_index('ix_affiliate_sales_affiliate_id', table_name='affiliate_sales')
+
+
+def downgrade() -> None:
+    op.create_index('ix_affiliate_sales_affiliate_id', 'affiliate_sales', ['affiliate_id'], unique=False)
+    op.drop_index('ix_affiliate_sales_affiliate_commission', table_name='affiliate_sales')
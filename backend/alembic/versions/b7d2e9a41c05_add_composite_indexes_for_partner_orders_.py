@@ -0,0 +1,39 @@
+"""Add composite indexes for partner orders and available inventory
+
+Revision ID: b7d2e9a41c05
+Revises: f3a8b954df0c
+Create Date: 2026-10-16 21:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e9a41c05'
+down_revision: Union[str, None] = 'f3a8b954df0c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_orders_partner_payment_created',
+        'orders',
+        ['fulfillment_partner_id', 'payment_status', 'created_at'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_pai_product_remaining',
+        'partner_allocated_inventory',
+        ['product_id', 'remaining_quantity'],
+        unique=False,
+        postgresql_where=sa.text('remaining_quantity > 0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pai_product_remaining', table_name='partner_allocated_inventory')
+    op.drop_index('ix_orders_partner_payment_created', table_name='orders')
@@ -0,0 +1,74 @@
+"""Add server-side UTC timestamp defaults
+
+Revision ID: c4e81f3a9d27
+Revises: b7d2e9a41c05
+Create Date: 2026-10-16 21:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e81f3a9d27'
+down_revision: Union[str, None] = 'b7d2e9a41c05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) - 기존 datetime.utcnow 기본값을 DB 기본값으로 이동
+TIMESTAMP_COLUMNS = [
+    ('customers', 'created_at'),
+    ('customers', 'updated_at'),
+    ('inquiries', 'created_at'),
+    ('inquiries', 'updated_at'),
+    ('products', 'created_at'),
+    ('products', 'updated_at'),
+    ('settings', 'updated_at'),
+    ('shipping_rates', 'created_at'),
+    ('shipping_rates', 'updated_at'),
+    ('users', 'created_at'),
+    ('users', 'updated_at'),
+    ('affiliates', 'created_at'),
+    ('affiliates', 'updated_at'),
+    ('fulfillment_partners', 'created_at'),
+    ('fulfillment_partners', 'updated_at'),
+    ('affiliate_clicks', 'clicked_at'),
+    ('affiliate_payments', 'created_at'),
+    ('affiliate_payments', 'updated_at'),
+    ('orders', 'created_at'),
+    ('orders', 'updated_at'),
+    ('partner_allocated_inventory', 'created_at'),
+    ('partner_allocated_inventory', 'updated_at'),
+    ('shipping_commission_payments', 'created_at'),
+    ('shipping_commission_payments', 'updated_at'),
+    ('affiliate_error_logs', 'created_at'),
+    ('affiliate_sales', 'created_at'),
+    ('email_logs', 'created_at'),
+    ('inventory_adjustment_logs', 'created_at'),
+    ('order_items', 'created_at'),
+    ('shipments', 'created_at'),
+    ('shipments', 'updated_at'),
+    ('shipment_allocations', 'allocated_at'),
+]
+
+
+def upgrade() -> None:
+    for table_name, column_name in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table_name,
+            column_name,
+            existing_type=sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+        )
+
+
+def downgrade() -> None:
+    for table_name, column_name in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table_name,
+            column_name,
+            existing_type=sa.DateTime(),
+            server_default=None,
+        )
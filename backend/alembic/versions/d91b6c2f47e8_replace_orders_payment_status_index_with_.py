@@ -0,0 +1,34 @@
+"""Replace orders payment_status index with covering index
+
+Revision ID: d91b6c2f47e8
+Revises: c4e81f3a9d27
+Create Date: 2026-10-16 22:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd91b6c2f47e8'
+down_revision: Union[str, None] = 'c4e81f3a9d27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_orders_payment_status_profit',
+        'orders',
+        ['payment_status'],
+        unique=False,
+        postgresql_include=['total_profit'],
+    )
+    op.drop_index('ix_orders_payment_status', table_name='orders')
+
+
+def downgrade() -> None:
+    op.create_index('ix_orders_payment_status', 'orders', ['payment_status'], unique=False)
+    op.drop_index('ix_orders_payment_status_profit', table_name='orders')
@@ -0,0 +1,32 @@
+"""Add partial index for refund requests
+
+Revision ID: e2b9d4a7c613
+Revises: a3f6c81d5e27
+Create Date: 2026-10-16 23:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b9d4a7c613'
+down_revision: Union[str, None] = 'a3f6c81d5e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_orders_refund_requested',
+        'orders',
+        ['refund_requested_at'],
+        unique=False,
+        postgresql_where=sa.text('refund_status IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_orders_refund_requested', table_name='orders')
@@ -6,8 +6,15 @@ AST를 이용한 Python 코드 분석
 
 import ast
 import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+
+# 파싱 결과 구조가 바뀌면 올려서 기존 캐시 무효화
+CACHE_VERSION = 1
+CACHE_FILE_NAME = "files.pkl"
 
 
 class ImportVisitor(ast.NodeVisitor):
@@ -51,50 +58,119 @@ class ImportVisitor(ast.NodeVisitor):
         self.generic_visit(node)
 
 
+def parse_file(file_path: Path, root_path: Path) -> Optional[Dict]:
+    """단일 파일 분석 (프로세스 풀에서 실행할 수 있도록 모듈 수준 순수 함수)
+
+    분석 실패 시 None 반환
+    """
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            content = f.read()
+
+        tree = ast.parse(content)
+        visitor = ImportVisitor(str(file_path))
+        visitor.visit(tree)
+
+        # 상대 경로 생성
+        relative_path = str(file_path.relative_to(root_path))
+
+        return {
+            "absolute_path": str(file_path),
+            "relative_path": relative_path,
+            "imports": visitor.imports,
+            "functions": visitor.functions,
+            "classes": visitor.classes,
+            "lines_of_code": len(content.splitlines()),
+            "file_size": len(content),
+        }
+
+    except SyntaxError as e:
+        print(f"⚠️  Syntax error in {file_path}: {e}")
+    except Exception as e:
+        print(f"❌ Error analyzing {file_path}: {e}")
+
+    return None
+
+
 class ASTAnalyzer:
     """Python 코드 AST 분석"""
 
-    def __init__(self, root_path: str = "src"):
+    def __init__(self, root_path: str = "src", jobs: int = 1, cache_dir: Optional[str] = ".arch_cache"):
         self.root_path = Path(root_path)
+        # 1보다 크면 파일 파싱을 프로세스 풀로 병렬 처리
+        self.jobs = jobs
+        # None이면 캐시 사용 안 함
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.files_info: Dict[str, Dict] = {}
 
     def analyze(self) -> Dict:
         """프로젝트 전체 분석"""
-        for py_file in self.root_path.rglob("*.py"):
-            if "__pycache__" in str(py_file):
-                continue
-
-            self._analyze_file(py_file)
+        py_files = [
+            py_file
+            for py_file in self.root_path.rglob("*.py")
+            if "__pycache__" not in str(py_file)
+        ]
+
+        # 수정 시각/크기가 같은 파일은 이전 실행의 파싱 결과 재사용
+        cache = self._load_cache()
+        stamps = {}
+        results: Dict[Path, Optional[Dict]] = {}
+        for py_file in py_files:
+            stat = py_file.stat()
+            stamps[py_file] = (stat.st_mtime_ns, stat.st_size)
+            cached = cache.get(str(py_file))
+            if cached and cached[0] == stamps[py_file]:
+                results[py_file] = cached[1]
+
+        misses = [py_file for py_file in py_files if py_file not in results]
+        if self.jobs > 1 and len(misses) > 1:
+            # ast.parse는 GIL을 잡고 있으므로 스레드 대신 프로세스 사용
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                parsed = list(
+                    executor.map(parse_file, misses, repeat(self.root_path), chunksize=16)
+                )
+        else:
+            parsed = [parse_file(py_file, self.root_path) for py_file in misses]
+        results.update(zip(misses, parsed))
+
+        for py_file in py_files:
+            file_info = results[py_file]
+            if file_info:
+                self.files_info[file_info["relative_path"]] = file_info
+
+        if misses or len(cache) != len(py_files):
+            self._save_cache({
+                str(py_file): (stamps[py_file], results[py_file])
+                for py_file in py_files
+                if results[py_file]
+            })
 
         return self.files_info
 
-    def _analyze_file(self, file_path: Path) -> None:
-        """단일 파일 분석"""
+    def _load_cache(self) -> Dict[str, Tuple]:
+        """파싱 결과 캐시 로드 (없거나 버전이 다르면 빈 캐시)"""
+        if not self.cache_dir:
+            return {}
+
+        try:
+            with open(self.cache_dir / CACHE_FILE_NAME, "rb") as f:
+                version, entries = pickle.load(f)
+        except Exception:
+            return {}
+
+        return entries if version == CACHE_VERSION else {}
+
+    def _save_cache(self, entries: Dict[str, Tuple]) -> None:
+        """파싱 결과 캐시 저장 (실패해도 분석 결과에는 영향 없음)"""
+        if not self.cache_dir:
+            return
+
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            tree = ast.parse(content)
-            visitor = ImportVisitor(str(file_path))
-            visitor.visit(tree)
-
-            # 상대 경로 생성
-            relative_path = str(file_path.relative_to(self.root_path))
-
-            self.files_info[relative_path] = {
-                "absolute_path": str(file_path),
-                "relative_path": relative_path,
-                "imports": visitor.imports,
-                "functions": visitor.functions,
-                "classes": visitor.classes,
-                "lines_of_code": len(content.splitlines()),
-                "file_size": len(content),
-            }
-
-        except SyntaxError as e:
-            print(f"⚠️  Syntax error in {file_path}: {e}")
-        except Exception as e:
-            print(f"❌ Error analyzing {file_path}: {e}")
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_dir / CACHE_FILE_NAME, "wb") as f:
+                pickle.dump((CACHE_VERSION, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            print(f"⚠️  Failed to write analysis cache: {e}")
 
     def get_file_info(self, file_path: str) -> Dict:
         """파일 정보 조회"""
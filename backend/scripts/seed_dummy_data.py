@@ -1,16 +1,22 @@
 """더미 데이터 생성 스크립트 - 개별 또는 조합으로 실행 가능"""
 
 import argparse
+import os
 import sys
+from datetime import datetime
 from pathlib import Path
 from uuid import uuid4
 
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import load_only, raiseload, sessionmaker
+from sqlalchemy.pool import NullPool
+
 # 프로젝트 루트 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.persistence.database import SessionLocal
+from src.config import settings
+from src.persistence.database import engine_options
 from src.persistence.models import Product, ShippingRate, User, FulfillmentPartner, Customer, Order
-from src.workflow.services.authentication_service import AuthenticationService
 from scripts.seeders import (
     ProductSeeder,
     UserSeeder,
@@ -23,7 +29,17 @@ from scripts.seeders import (
     ShippingCommissionPaymentSeeder,
     ShipmentSeeder,
     RefundSeeder,
+    hash_seed_password,
+)
+
+# 일회성 스크립트이므로 커넥션 풀 없이 사용 (종료 시 남는 커넥션 없음)
+seed_engine = create_engine(
+    settings.DATABASE_URL,
+    echo=settings.SQL_ECHO,
+    poolclass=NullPool,
+    **engine_options,
 )
+SeedSession = sessionmaker(autocommit=False, autoflush=False, bind=seed_engine)
 
 
 def print_separator(title: str = ""):
@@ -113,16 +129,34 @@ def print_result(result: dict):
             print(f"    요청 날짜: {order.refund_requested_at}\n")
 
 
+def enable_fast_seed(db):
+    """SEED_FAST=1일 때 시딩 트랜잭션의 커밋 동기화 완화 (로컬 개발 DB 전용)"""
+    if os.getenv("SEED_FAST") != "1":
+        return
+
+    if db.get_bind().dialect.name == "postgresql":
+        # 현재 트랜잭션에만 적용 - 커밋 시 WAL fsync를 기다리지 않음
+        db.execute(text("SET LOCAL synchronous_commit TO OFF"))
+        print("⚡ SEED_FAST: synchronous_commit=off\n")
+
+
+def has_rows(db, model) -> bool:
+    """테이블에 행이 있는지 확인 (ORM 객체 생성 없이 id 하나만 조회)"""
+    return db.execute(select(model.id).limit(1)).scalar() is not None
+
+
 def check_existing_data(db):
     """기존 데이터 확인"""
-    existing_product = db.query(Product).first()
-    existing_shipping = db.query(ShippingRate).first()
-    existing_user = db.query(User).first()
-
-    if existing_product or existing_shipping or existing_user:
+    # 앞 테이블에 데이터가 있으면 나머지는 조회하지 않음
+    if any(has_rows(db, model) for model in (Product, ShippingRate, User)):
         print("⚠️  데이터베이스에 기존 데이터가 있습니다.")
         print("\n기존 상품:")
-        products = db.query(Product).all()
+        # 목록 출력에는 id, name만 필요 - 나머지 컬럼/관계는 로드하지 않음
+        products = (
+            db.query(Product)
+            .options(load_only(Product.id, Product.name), raiseload("*"))
+            .all()
+        )
         for product in products[:5]:  # 처음 5개만
             print(f"  • {product.name} (ID: {product.id})")
         if len(products) > 5:
@@ -186,72 +220,74 @@ def delete_all_data(db):
     if deleted_influencer_users > 0:
         print(f"✅ influencer users: {deleted_influencer_users}명 삭제됨")
 
-    db.commit()
+    # 커밋은 이후 시딩과 함께 한 번에 (시딩 실패 시 삭제도 롤백)
+    db.flush()
     print("\n✅ 데이터 삭제 완료!\n")
 
 
 def seed_all(db):
     """모든 더미 데이터 생성 (조합 방식)"""
     results = {}
+    now = datetime.utcnow()
 
     print_separator("1️⃣  상품 생성 중...")
-    product_seeder = ProductSeeder(db)
+    product_seeder = ProductSeeder(db, now)
     results["products"] = product_seeder.seed()
     print_result(results["products"])
 
     print_separator("2️⃣  배송담당자 사용자 생성 중...")
-    user_seeder = UserSeeder(db)
+    user_seeder = UserSeeder(db, now)
     results["users"] = user_seeder.seed()
     print_result(results["users"])
 
     print_separator("3️⃣  배송담당자 정보 생성 중...")
-    partner_seeder = FulfillmentPartnerSeeder(db)
+    partner_seeder = FulfillmentPartnerSeeder(db, now)
     results["partners"] = partner_seeder.seed(results["users"])
     print_result(results["partners"])
 
     print_separator("4️⃣  배송료 생성 중...")
-    rate_seeder = ShippingRateSeeder(db)
+    rate_seeder = ShippingRateSeeder(db, now)
     results["rates"] = rate_seeder.seed()
     print_result(results["rates"])
 
     print_separator("5️⃣  고객 생성 중...")
-    customer_seeder = CustomerSeeder(db)
+    customer_seeder = CustomerSeeder(db, now)
     results["customers"] = customer_seeder.seed()
     print_result(results["customers"])
 
     print_separator("6️⃣  재고 할당 중...")
-    inventory_seeder = InventorySeeder(db)
+    inventory_seeder = InventorySeeder(db, now)
     results["inventory"] = inventory_seeder.seed(
         results["partners"], results["products"]
     )
     print_result(results["inventory"])
 
     print_separator("7️⃣  주문 생성 중...")
-    order_seeder = OrderSeeder(db)
+    order_seeder = OrderSeeder(db, now)
     results["orders"] = order_seeder.seed(
         results["customers"], results["partners"], results["products"]
     )
     print_result(results["orders"])
 
     print_separator("8️⃣  배송 정보 생성 중...")
-    shipment_seeder = ShipmentSeeder(db)
+    shipment_seeder = ShipmentSeeder(db, now)
     results["shipments"] = shipment_seeder.seed(results["orders"])
     print_result(results["shipments"])
 
     print_separator("9️⃣  인플루언서 테스트 계정 생성 중...")
-    affiliate_seeder = AffiliateSeeder(db)
+    affiliate_seeder = AffiliateSeeder(db, now)
     results["influencers"] = affiliate_seeder.seed(orders_result=results["orders"])
     print_result(results["influencers"])
 
     print_separator("🔟  배송담당자 커미션 지급 데이터 생성 중...")
-    commission_seeder = ShippingCommissionPaymentSeeder(db)
+    commission_seeder = ShippingCommissionPaymentSeeder(db, now)
     results["shipping_commissions"] = commission_seeder.seed(
         results["partners"], results["orders"]
     )
     print_result(results["shipping_commissions"])
 
     print_separator("1️⃣1️⃣  환불 요청 데이터 생성 중...")
-    refund_seeder = RefundSeeder(db)
+    refund_seeder = RefundSeeder(db, now)
     results["refunds"] = refund_seeder.seed(results["orders"])
     print_result(results["refunds"])
 
@@ -260,17 +296,17 @@ def seed_all(db):
     admin_user = db.query(User).filter(User.email == "nadle@naver.com").first()
     if admin_user:
         db.delete(admin_user)
-        db.commit()
+        db.flush()
 
     admin_user = User(
         id=uuid4(),
         email="nadle@naver.com",
-        password_hash=AuthenticationService.hash_password("0000"),
+        password_hash=hash_seed_password("0000"),
         role="admin",
         is_active=True,
     )
     db.add(admin_user)
-    db.commit()
+    db.flush()
     print(f"✅ 관리자 계정 생성됨")
     print(f"  - 이메일: nadle@naver.com")
     print(f"  - 비밀번호: 0000\n")
@@ -297,6 +333,9 @@ def main():
   python -m scripts.seed_dummy_data --products --users --partners
   python -m scripts.seed_dummy_data --customers --orders
   python -m scripts.seed_dummy_data --all --influencer
+
+  # 로컬 개발 DB 빠른 재생성 (커밋 동기화 완화)
+  SEED_FAST=1 python -m scripts.seed_dummy_data --all --force
         """,
     )
 
@@ -350,9 +389,11 @@ def main():
 
     args = parser.parse_args()
 
-    db = SessionLocal()
+    db = SeedSession()
 
     try:
+        enable_fast_seed(db)
+
         # 옵션 처리
         if args.check:
             has_data = check_existing_data(db)
@@ -370,68 +411,83 @@ def main():
                 return
 
             seed_all(db)
+
+            # 삭제 + 전체 시딩을 하나의 트랜잭션으로 커밋
+            db.commit()
             return
 
         # 개별 또는 조합 생성
+        # 전체를 한 번에 커밋하므로, 선행 조건은 어떤 Seeder도 실행하기 전에 모두 확인
+        prerequisites = [
+            (args.partners, [args.users], "❌ 배송담당자 생성을 위해 먼저 --users를 실행하세요."),
+            (
+                args.inventory,
+                [args.products, args.partners],
+                "❌ 재고 할당을 위해 먼저 --products와 --partners를 실행하세요.",
+            ),
+            (
+                args.orders,
+                [args.customers, args.partners, args.products],
+                "❌ 주문 생성을 위해 먼저 --customers, --partners, --products를 실행하세요.",
+            ),
+            (
+                args.shipping_commissions,
+                [args.partners, args.orders],
+                "❌ 배송담당자 커미션 생성을 위해 먼저 --partners와 --orders를 실행하세요.",
+            ),
+            (args.refunds, [args.orders], "❌ 환불 요청 생성을 위해 먼저 --orders를 실행하세요."),
+        ]
+        missing = [message for requested, required, message in prerequisites if requested and not all(required)]
+        if missing:
+            for message in missing:
+                print(message)
+            print("   아무 데이터도 생성하지 않았습니다.")
+            return
+
         results = {}
+        now = datetime.utcnow()
 
         if args.products:
             print_separator("상품 생성 중...")
-            product_seeder = ProductSeeder(db)
+            product_seeder = ProductSeeder(db, now)
             results["products"] = product_seeder.seed()
             print_result(results["products"])
 
         if args.users:
             print_separator("배송담당자 사용자 생성 중...")
-            user_seeder = UserSeeder(db)
+            user_seeder = UserSeeder(db, now)
             results["users"] = user_seeder.seed()
             print_result(results["users"])
 
         if args.partners:
-            if "users" not in results:
-                print("❌ 배송담당자 생성을 위해 먼저 --users를 실행하세요.")
-                return
-
             print_separator("배송담당자 정보 생성 중...")
-            partner_seeder = FulfillmentPartnerSeeder(db)
+            partner_seeder = FulfillmentPartnerSeeder(db, now)
             results["partners"] = partner_seeder.seed(results["users"])
             print_result(results["partners"])
 
         if args.shipping_rates:
             print_separator("배송료 생성 중...")
-            rate_seeder = ShippingRateSeeder(db)
+            rate_seeder = ShippingRateSeeder(db, now)
             results["rates"] = rate_seeder.seed()
             print_result(results["rates"])
 
         if args.customers:
             print_separator("고객 생성 중...")
-            customer_seeder = CustomerSeeder(db)
+            customer_seeder = CustomerSeeder(db, now)
             results["customers"] = customer_seeder.seed()
             print_result(results["customers"])
 
         if args.inventory:
-            if "products" not in results or "partners" not in results:
-                print("❌ 재고 할당을 위해 먼저 --products와 --partners를 실행하세요.")
-                return
-
             print_separator("재고 할당 중...")
-            inventory_seeder = InventorySeeder(db)
+            inventory_seeder = InventorySeeder(db, now)
             results["inventory"] = inventory_seeder.seed(
                 results["partners"], results["products"]
             )
             print_result(results["inventory"])
 
         if args.orders:
-            if (
-                "customers" not in results
-                or "partners" not in results
-                or "products" not in results
-            ):
-                print("❌ 주문 생성을 위해 먼저 --customers, --partners, --products를 실행하세요.")
-                return
-
             print_separator("주문 생성 중...")
-            order_seeder = OrderSeeder(db)
+            order_seeder = OrderSeeder(db, now)
             results["orders"] = order_seeder.seed(
                 results["customers"], results["partners"], results["products"]
             )
@@ -439,34 +495,29 @@ def main():
 
         if args.influencer:
             print_separator("인플루언서 테스트 계정 생성 중...")
-            affiliate_seeder = AffiliateSeeder(db)
+            affiliate_seeder = AffiliateSeeder(db, now)
             results["influencers"] = affiliate_seeder.seed(
                 orders_result=results.get("orders")
             )
             print_result(results["influencers"])
 
         if args.shipping_commissions:
-            if "partners" not in results or "orders" not in results:
-                print("❌ 배송담당자 커미션 생성을 위해 먼저 --partners와 --orders를 실행하세요.")
-                return
-
             print_separator("배송담당자 커미션 지급 데이터 생성 중...")
-            commission_seeder = ShippingCommissionPaymentSeeder(db)
+            commission_seeder = ShippingCommissionPaymentSeeder(db, now)
             results["shipping_commissions"] = commission_seeder.seed(
                 results["partners"], results["orders"]
             )
             print_result(results["shipping_commissions"])
 
         if args.refunds:
-            if "orders" not in results:
-                print("❌ 환불 요청 생성을 위해 먼저 --orders를 실행하세요.")
-                return
-
             print_separator("환불 요청 데이터 생성 중...")
-            refund_seeder = RefundSeeder(db)
+            refund_seeder = RefundSeeder(db, now)
             results["refunds"] = refund_seeder.seed(results["orders"])
             print_result(results["refunds"])
 
+        # 선택된 Seeder 전체를 하나의 트랜잭션으로 커밋
+        db.commit()
+
         if not any([
             args.products,
             args.users,
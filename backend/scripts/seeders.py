@@ -1,11 +1,19 @@
 """각 모델별 Seeder 클래스들"""
 
+import csv
+import io
+import os
+import secrets
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from decimal import Decimal
-from uuid import uuid4
+from functools import lru_cache
+from decimal import ROUND_HALF_UP, Decimal
+from types import SimpleNamespace
+from uuid import UUID, uuid4
 from typing import Dict, List, Any
 
+from sqlalchemy import Table, insert, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from src.persistence.models import (
@@ -26,24 +34,303 @@ from src.persistence.models import (
 )
 from src.workflow.services.authentication_service import AuthenticationService
 
+# PayPal 거래 수수료율 (3.4%)
+PAYPAL_FEE_RATE = Decimal("0.034")
+# 상품에 순이윤이 지정되지 않은 경우의 기본값
+DEFAULT_PROFIT_PER_UNIT = Decimal("80")
+ZERO = Decimal("0")
+CENT = Decimal("0.01")
+# 인플루언서 판매 1건당 마케팅 커미션 / 미지급 지급 예정액
+AFFILIATE_SALE_COMMISSION = Decimal("15.00")
+AFFILIATE_PENDING_PAYMENT = Decimal("45.00")
+# 인플루언서별 테스트 클릭 수
+CLICKS_PER_AFFILIATE = 150
+# NCR 배송담당자 미지급 커미션 (6개 주문 * 20 USD)
+PARTNER_PENDING_COMMISSION = Decimal("120.00")
+
+
+# 기본 상품 데이터
+DEFAULT_PRODUCTS = (
+    {
+        "name": "조선미녀 맑은쌀 선크림 50ml",
+        "description": "프리미엄 쌀 추출물 함유 자외선 차단 크림, 민감한 피부에 안전",
+        "price": 28.99,
+        "sku": "JOSEONMINYEO-RICECREAM-50ML",
+        "image_url": "https://example.com/joseon-rice-cream.jpg",
+    },
+)
+
+# 기본 배송담당자 (사용자 + 배송담당자 정보) 데이터
+DEFAULT_PARTNERS = (
+    {
+        "name": "조선미녀 필리핀 배송담당자 - NCR",
+        "email": "ncr.partner@example.com",
+        "phone": "+63-917-123-4567",
+        "address": "Manila Business District, Metro Manila",
+        "region": "NCR",
+    },
+    {
+        "name": "조선미녀 필리핀 배송담당자 - Visayas",
+        "email": "visayas.partner@example.com",
+        "phone": "+63-917-234-5678",
+        "address": "Cebu IT Park, Cebu City",
+        "region": "Visayas",
+    },
+)
+
+# 기본 지역별 배송료 데이터
+DEFAULT_SHIPPING_RATES = (
+    {"region": "NCR", "fee": 100},
+    {"region": "Luzon", "fee": 120},
+    {"region": "Visayas", "fee": 140},
+    {"region": "Mindanao", "fee": 160},
+)
+
+# 기본 고객 데이터
+DEFAULT_CUSTOMERS = (
+    {
+        "email": "maria.santos@example.ph",
+        "name": "Maria Santos",
+        "phone": "09178901234",
+        "address": "Makati Commercial Center, Makati City",
+        "region": "NCR",
+    },
+    {
+        "email": "juan.dela.cruz@example.ph",
+        "name": "Juan Dela Cruz",
+        "phone": "09267890123",
+        "address": "Cebu IT Park, Cebu City",
+        "region": "Visayas",
+    },
+    {
+        "email": "rosa.garcia@example.ph",
+        "name": "Rosa Garcia",
+        "phone": "09356789012",
+        "address": "SM City Davao, Davao City",
+        "region": "Mindanao",
+    },
+)
+
+# 기본 배송담당자별 재고 할당 데이터
+DEFAULT_INVENTORY = (
+    {
+        "partner_name": "조선미녀 필리핀 배송담당자 - NCR",
+        "product_sku": "JOSEONMINYEO-RICECREAM-50ML",
+        "quantity": 30,
+    },
+    {
+        "partner_name": "조선미녀 필리핀 배송담당자 - Visayas",
+        "product_sku": "JOSEONMINYEO-RICECREAM-50ML",
+        "quantity": 20,
+    },
+)
+
+# 기본 주문 데이터
+DEFAULT_ORDERS = (
+    # 배송 준비 중 (preparing) - 배송담당자 1 (NCR) - 2개
+    {
+        "customer_index": 0,  # Maria Santos
+        "partner_name": "조선미녀 필리핀 배송담당자 - NCR",
+        "items": [
+            {"product_sku": "JOSEONMINYEO-RICECREAM-50ML", "quantity": 2},
+        ],
+        "shipping_fee": Decimal("100.00"),
+        "shipping_status": "preparing",
+        "shipping_commission": Decimal("20.00"),
+    },
+    {
+        "customer_index": 1,  # Juan Dela Cruz
+        "partner_name": "조선미녀 필리핀 배송담당자 - NCR",
+        "items": [
+            {"product_sku": "JOSEONMINYEO-RICECREAM-50ML", "quantity": 1},
+        ],
+        "shipping_fee": Decimal("100.00"),
+        "shipping_status": "preparing",
+        "shipping_commission": Decimal("20.00"),
+    },
+    # 배송 중 (in_transit) - 배송담당자 1 (NCR) - 2개
+    {
+        "customer_index": 2,  # Rosa Garcia
+        "partner_name": "조선미녀 필리핀 배송담당자 - NCR",
+        "items": [
+            {"product_sku": "JOSEONMINYEO-RICECREAM-50ML", "quantity": 1},
+        ],
+        "shipping_fee": Decimal("100.00"),
+        "shipping_status": "in_transit",
+        "shipping_commission": Decimal("20.00"),
+    },
+    {
+        "customer_index": 0,  # Maria Santos
+        "partner_name": "조선미녀 필리핀 배송담당자 - NCR",
+        "items": [
+            {"product_sku": "JOSEONMINYEO-RICECREAM-50ML", "quantity": 2},
+        ],
+        "shipping_fee": Decimal("100.00"),
+        "shipping_status": "in_transit",
+        "shipping_commission": Decimal("20.00"),
+    },
+    # 배송 완료 (delivered) - 배송담당자 1 (NCR) - 2개
+    {
+        "customer_index": 1,  # Juan Dela Cruz
+        "partner_name": "조선미녀 필리핀 배송담당자 - NCR",
+        "items": [
+            {"product_sku": "JOSEONMINYEO-RICECREAM-50ML", "quantity": 3},
+        ],
+        "shipping_fee": Decimal("100.00"),
+        "shipping_status": "delivered",
+        "shipping_commission": Decimal("20.00"),
+    },
+    {
+        "customer_index": 2,  # Rosa Garcia
+        "partner_name": "조선미녀 필리핀 배송담당자 - NCR",
+        "items": [
+            {"product_sku": "JOSEONMINYEO-RICECREAM-50ML", "quantity": 1},
+        ],
+        "shipping_fee": Decimal("100.00"),
+        "shipping_status": "delivered",
+        "shipping_commission": Decimal("20.00"),
+    },
+    # 배송 준비 중 (preparing) - 배송담당자 2 (Visayas)
+    {
+        "customer_index": 0,  # Maria Santos
+        "partner_name": "조선미녀 필리핀 배송담당자 - Visayas",
+        "items": [
+            {"product_sku": "JOSEONMINYEO-RICECREAM-50ML", "quantity": 2},
+        ],
+        "shipping_fee": Decimal("120.00"),
+        "shipping_status": "preparing",
+        "shipping_commission": Decimal("25.00"),
+    },
+    # 배송 중 (in_transit) - 배송담당자 2 (Visayas)
+    {
+        "customer_index": 1,  # Juan Dela Cruz
+        "partner_name": "조선미녀 필리핀 배송담당자 - Visayas",
+        "items": [
+            {"product_sku": "JOSEONMINYEO-RICECREAM-50ML", "quantity": 3},
+        ],
+        "shipping_fee": Decimal("120.00"),
+        "shipping_status": "in_transit",
+        "shipping_commission": Decimal("25.00"),
+    },
+    # 배송 완료 (delivered) - 배송담당자 2 (Visayas)
+    {
+        "customer_index": 2,  # Rosa Garcia
+        "partner_name": "조선미녀 필리핀 배송담당자 - Visayas",
+        "items": [
+            {"product_sku": "JOSEONMINYEO-RICECREAM-50ML", "quantity": 1},
+        ],
+        "shipping_fee": Decimal("120.00"),
+        "shipping_status": "delivered",
+        "shipping_commission": Decimal("25.00"),
+    },
+)
+
+# 기본 인플루언서 데이터
+DEFAULT_AFFILIATES = (
+    {
+        "email": "influencer1@example.com",
+        "password": "test123456",
+        "code": "influencer-no-payment",
+        "name": "Influencer No Payment",
+        "has_pending_payment": False,
+    },
+    {
+        "email": "influencer2@example.com",
+        "password": "test123456",
+        "code": "influencer-with-payment",
+        "name": "Influencer With Payment",
+        "has_pending_payment": True,
+    },
+)
+
+
+@lru_cache(maxsize=None)
+def _insert_statement(table: Table, page_size: int):
+    """테이블별 INSERT 문은 한 번만 만들어 재사용"""
+    return insert(table).execution_options(insertmanyvalues_page_size=page_size)
+
+
+@lru_cache(maxsize=None, typed=True)
+def _dec(value: Any) -> Decimal:
+    """숫자 -> Decimal 변환 (반복되는 가격/배송비 값은 한 번만 파싱)"""
+    return Decimal(str(value))
+
+
+def _to_cents(value: Decimal) -> int:
+    """금액 -> 정수 센트 (Numeric(10, 2) 컬럼에 저장되는 값과 같게 반올림)"""
+    return int(value.quantize(CENT, rounding=ROUND_HALF_UP).scaleb(2))
+
+
+def _uuid_batch(n: int) -> List[UUID]:
+    """UUID4 n개를 os.urandom 한 번으로 생성 (대량 행 PK용)"""
+    raw = os.urandom(16 * n)
+    # version=4 지정 시 RFC 4122 version/variant 비트가 설정됨
+    return [UUID(bytes=raw[i:i + 16], version=4) for i in range(0, 16 * n, 16)]
+
+
+@lru_cache(maxsize=128)
+def hash_seed_password(password: str) -> str:
+    """더미 계정 비밀번호 해싱 (같은 비밀번호는 프로세스 내에서 한 번만 계산)"""
+    return AuthenticationService.hash_password(password)
+
+
+def _hash_passwords(passwords: List[str]) -> List[str]:
+    """비밀번호 목록을 한 번에 해싱"""
+    return [hash_seed_password(password) for password in passwords]
+
+
+def bulk_copy_or_insert(session: Session, model, rows: List[Dict], page_size: int = 1000) -> None:
+    """대량 행 삽입 - PostgreSQL은 COPY FROM STDIN, 그 외는 bulk INSERT
+
+    rows는 모두 같은 키를 가진 dict 목록 (첫 행의 키 순서를 컬럼 순서로 사용)
+    """
+    if not rows:
+        return
+
+    table = model.__table__
+    if session.get_bind().dialect.name != "postgresql":
+        session.execute(_insert_statement(table, page_size), rows)
+        return
+
+    columns = list(rows[0])
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # None은 빈 필드로 기록되어 COPY CSV에서 NULL로 처리됨
+    writer.writerows([row[column] for column in columns] for row in rows)
+    buffer.seek(0)
+
+    # 세션과 같은 커넥션(트랜잭션)에서 실행
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH CSV",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
 
 class BaseSeeder(ABC):
     """Seeder 기본 클래스"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, now: datetime = None):
         self.db = db
+        # 한 번의 시딩에서 모든 행이 같은 기준 시각을 공유 (UTC, naive - 컬럼 타입과 동일)
+        self.now = now or datetime.utcnow()
 
     @abstractmethod
     def seed(self) -> Dict[str, Any]:
         """데이터 생성 및 반환"""
         pass
 
-    def commit(self):
-        """커밋"""
-        self.db.commit()
+    def _bulk_insert(self, model, rows: List[Dict], page_size: int = 1000) -> None:
+        """행 목록을 Core INSERT 한 번으로 삽입 (page_size 단위 multi-row VALUES)"""
+        if not rows:
+            return
+        self.db.execute(_insert_statement(model.__table__, page_size), rows)
 
     def flush(self):
-        """플러시"""
+        """플러시 (커밋은 시딩 전체를 실행하는 쪽에서 한 번만 수행)"""
         self.db.flush()
 
 
@@ -53,39 +340,35 @@ class ProductSeeder(BaseSeeder):
     def seed(self, products_data: List[Dict] = None) -> Dict[str, Any]:
         """상품 생성"""
         if products_data is None:
-            products_data = [
-                {
-                    "name": "조선미녀 맑은쌀 선크림 50ml",
-                    "description": "프리미엄 쌀 추출물 함유 자외선 차단 크림, 민감한 피부에 안전",
-                    "price": 28.99,
-                    "sku": "JOSEONMINYEO-RICECREAM-50ML",
-                    "image_url": "https://example.com/joseon-rice-cream.jpg",
-                },
-            ]
-
-        created_products = {}
-        for product_data in products_data:
-            product = Product(
-                id=uuid4(),
-                name=product_data["name"],
-                description=product_data["description"],
-                price=Decimal(str(product_data["price"])),
-                sku=product_data["sku"],
-                image_url=product_data.get("image_url", ""),
-                profit_per_unit=Decimal(str(product_data.get("profit_per_unit", 80))),
-                is_active=product_data.get("is_active", True),
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-            )
-            self.db.add(product)
-            created_products[product_data["sku"]] = product
+            products_data = DEFAULT_PRODUCTS
+
+        rows = [
+            {
+                "id": uuid4(),
+                "name": product_data["name"],
+                "description": product_data["description"],
+                "price": _dec(product_data["price"]),
+                "sku": product_data["sku"],
+                "image_url": product_data.get("image_url", ""),
+                "profit_per_unit": _dec(product_data.get("profit_per_unit", DEFAULT_PROFIT_PER_UNIT)),
+                "is_active": product_data.get("is_active", True),
+                "created_at": self.now,
+                "updated_at": self.now,
+            }
+            for product_data in products_data
+        ]
+        self._bulk_insert(Product, rows)
+
+        self.flush()
 
-        self.commit()
+        created_products = {row["sku"]: SimpleNamespace(**row) for row in rows}
 
         return {
             "type": "products",
             "count": len(created_products),
             "data": created_products,
+            # 하위 Seeder용 SKU -> 상품 ID 맵
+            "sku_to_id": {row["sku"]: row["id"] for row in rows},
         }
 
 
@@ -95,54 +378,44 @@ class UserSeeder(BaseSeeder):
     def seed(self, partners_data: List[Dict] = None) -> Dict[str, Any]:
         """배송담당자 사용자 생성"""
         if partners_data is None:
-            partners_data = [
-                {
-                    "name": "조선미녀 필리핀 배송담당자 - NCR",
-                    "email": "ncr.partner@example.com",
-                    "phone": "+63-917-123-4567",
-                    "address": "Manila Business District, Metro Manila",
-                    "region": "NCR",
-                },
-                {
-                    "name": "조선미녀 필리핀 배송담당자 - Visayas",
-                    "email": "visayas.partner@example.com",
-                    "phone": "+63-917-234-5678",
-                    "address": "Cebu IT Park, Cebu City",
-                    "region": "Visayas",
-                },
-            ]
+            partners_data = DEFAULT_PARTNERS
 
+        rows = []
         created_users = {}
         partner_credentials = {}
 
-        for partner_data in partners_data:
+        passwords = [f"Partner@{partner_data['region']}123" for partner_data in partners_data]
+        password_hashes = _hash_passwords(passwords)
+
+        for partner_data, password, password_hash in zip(
+            partners_data, passwords, password_hashes
+        ):
             email = partner_data["email"]
-            password = f"Partner@{partner_data['region']}123"
-            password_hash = AuthenticationService.hash_password(password)
-
-            user = User(
-                id=uuid4(),
-                email=email,
-                password_hash=password_hash,
-                role="fulfillment_partner",
-                is_active=True,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-            )
-            self.db.add(user)
-            self.flush()
+
+            # id를 미리 생성하므로 FulfillmentPartner 연결에 flush가 필요 없음
+            row = {
+                "id": uuid4(),
+                "email": email,
+                "password_hash": password_hash,
+                "role": "fulfillment_partner",
+                "created_at": self.now,
+                "updated_at": self.now,
+            }
+            rows.append(row)
 
             created_users[partner_data["name"]] = {
-                "user": user,
+                "user": SimpleNamespace(**row),
                 "partner_data": partner_data,
             }
             partner_credentials[partner_data["name"]] = {
                 "email": email,
                 "password": password,
-                "user_id": str(user.id),
+                "user_id": str(row["id"]),
             }
 
-        self.commit()
+        self._bulk_insert(User, rows)
+
+        self.flush()
 
         return {
             "type": "users",
@@ -163,28 +436,31 @@ class FulfillmentPartnerSeeder(BaseSeeder):
             )
 
         created_partners = {}
+        rows = []
         user_data_dict = users_result["data"]
 
         for partner_name, user_info in user_data_dict.items():
             user = user_info["user"]
             partner_data = user_info["partner_data"]
 
-            partner = FulfillmentPartner(
-                id=uuid4(),
-                user_id=user.id,
-                name=partner_data["name"],
-                email=partner_data["email"],
-                phone=partner_data["phone"],
-                address=partner_data["address"],
-                region=partner_data["region"],
-                is_active=partner_data.get("is_active", True),
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-            )
-            self.db.add(partner)
-            created_partners[partner_name] = partner
+            row = {
+                "id": uuid4(),
+                "user_id": user.id,
+                "name": partner_data["name"],
+                "email": partner_data["email"],
+                "phone": partner_data["phone"],
+                "address": partner_data["address"],
+                "region": partner_data["region"],
+                "is_active": partner_data.get("is_active", True),
+                "created_at": self.now,
+                "updated_at": self.now,
+            }
+            rows.append(row)
+            created_partners[partner_name] = SimpleNamespace(**row)
+
+        self._bulk_insert(FulfillmentPartner, rows)
 
-        self.commit()
+        self.flush()
 
         return {
             "type": "fulfillment_partners",
@@ -199,26 +475,37 @@ class ShippingRateSeeder(BaseSeeder):
     def seed(self, rates_data: List[Dict] = None) -> Dict[str, Any]:
         """배송료 생성"""
         if rates_data is None:
-            rates_data = [
-                {"region": "NCR", "fee": 100},
-                {"region": "Luzon", "fee": 120},
-                {"region": "Visayas", "fee": 140},
-                {"region": "Mindanao", "fee": 160},
-            ]
-
-        created_rates = {}
-        for rate_data in rates_data:
-            rate = ShippingRate(
-                id=uuid4(),
-                region=rate_data["region"],
-                fee=Decimal(str(rate_data["fee"])),
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+            rates_data = DEFAULT_SHIPPING_RATES
+
+        rows = [
+            {
+                "id": uuid4(),
+                "region": rate_data["region"],
+                # Numeric(10, 2) 컬럼과 같은 자릿수로 맞춤
+                "fee": _dec(rate_data["fee"]).quantize(CENT),
+                "created_at": self.now,
+                "updated_at": self.now,
+            }
+            for rate_data in rates_data
+        ]
+        if rows and self.db.get_bind().dialect.name == "postgresql":
+            # 이미 등록된 지역은 건너뜀 (재실행해도 region 유니크 제약 위반 없음)
+            # 실제로 삽입된 지역만 RETURNING 으로 받아서 결과에 포함
+            inserted_regions = set(
+                self.db.scalars(
+                    pg_insert(ShippingRate)
+                    .on_conflict_do_nothing(index_elements=["region"])
+                    .returning(ShippingRate.region),
+                    rows,
+                )
             )
-            self.db.add(rate)
-            created_rates[rate_data["region"]] = rate
+            rows = [row for row in rows if row["region"] in inserted_regions]
+        else:
+            self._bulk_insert(ShippingRate, rows)
+
+        self.flush()
 
-        self.commit()
+        created_rates = {row["region"]: SimpleNamespace(**row) for row in rows}
 
         return {
             "type": "shipping_rates",
@@ -233,46 +520,26 @@ class CustomerSeeder(BaseSeeder):
     def seed(self, customers_data: List[Dict] = None) -> Dict[str, Any]:
         """고객 생성"""
         if customers_data is None:
-            customers_data = [
-                {
-                    "email": "maria.santos@example.ph",
-                    "name": "Maria Santos",
-                    "phone": "09178901234",
-                    "address": "Makati Commercial Center, Makati City",
-                    "region": "NCR",
-                },
-                {
-                    "email": "juan.dela.cruz@example.ph",
-                    "name": "Juan Dela Cruz",
-                    "phone": "09267890123",
-                    "address": "Cebu IT Park, Cebu City",
-                    "region": "Visayas",
-                },
-                {
-                    "email": "rosa.garcia@example.ph",
-                    "name": "Rosa Garcia",
-                    "phone": "09356789012",
-                    "address": "SM City Davao, Davao City",
-                    "region": "Mindanao",
-                },
-            ]
-
-        created_customers = []
-        for cust_data in customers_data:
-            customer = Customer(
-                id=uuid4(),
-                email=cust_data["email"],
-                name=cust_data["name"],
-                phone=cust_data["phone"],
-                address=cust_data["address"],
-                region=cust_data["region"],
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-            )
-            self.db.add(customer)
-            created_customers.append(customer)
+            customers_data = DEFAULT_CUSTOMERS
+
+        rows = [
+            {
+                "id": uuid4(),
+                "email": cust_data["email"],
+                "name": cust_data["name"],
+                "phone": cust_data["phone"],
+                "address": cust_data["address"],
+                "region": cust_data["region"],
+                "created_at": self.now,
+                "updated_at": self.now,
+            }
+            for cust_data in customers_data
+        ]
+        self._bulk_insert(Customer, rows)
+
+        self.flush()
 
-        self.commit()
+        created_customers = [SimpleNamespace(**row) for row in rows]
 
         return {
             "type": "customers",
@@ -300,46 +567,37 @@ class InventorySeeder(BaseSeeder):
             raise ValueError("재고 할당을 위해 먼저 배송담당자와 상품을 생성해야 합니다.")
 
         if inventory_data is None:
-            inventory_data = [
-                {
-                    "partner_name": "조선미녀 필리핀 배송담당자 - NCR",
-                    "product_sku": "JOSEONMINYEO-RICECREAM-50ML",
-                    "quantity": 30,
-                },
-                {
-                    "partner_name": "조선미녀 필리핀 배송담당자 - Visayas",
-                    "product_sku": "JOSEONMINYEO-RICECREAM-50ML",
-                    "quantity": 20,
-                },
-            ]
+            inventory_data = DEFAULT_INVENTORY
 
         partners_dict = partners_result["data"]
-        products_dict = products_result["data"]
+        product_id_by_sku = products_result["sku_to_id"]
 
+        rows = []
         created_inventory = []
         total_quantity = 0
 
         for inv_data in inventory_data:
             partner = partners_dict.get(inv_data["partner_name"])
-            product = products_dict.get(inv_data["product_sku"])
-
-            if partner and product:
-                allocated_inv = PartnerAllocatedInventory(
-                    id=uuid4(),
-                    partner_id=partner.id,
-                    product_id=product.id,
-                    allocated_quantity=inv_data["quantity"],
-                    remaining_quantity=inv_data["quantity"],
-                    stock_version=0,
-                    allocated_date=datetime.utcnow().date(),
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                )
-                self.db.add(allocated_inv)
-                created_inventory.append(allocated_inv)
+            product_id = product_id_by_sku.get(inv_data["product_sku"])
+
+            if partner and product_id:
+                row = {
+                    "id": uuid4(),
+                    "partner_id": partner.id,
+                    "product_id": product_id,
+                    "allocated_quantity": inv_data["quantity"],
+                    "remaining_quantity": inv_data["quantity"],
+                    "allocated_date": self.now.date(),
+                    "created_at": self.now,
+                    "updated_at": self.now,
+                }
+                rows.append(row)
+                created_inventory.append(SimpleNamespace(**row, partner=partner))
                 total_quantity += inv_data["quantity"]
 
-        self.commit()
+        self._bulk_insert(PartnerAllocatedInventory, rows)
+
+        self.flush()
 
         return {
             "type": "inventory",
@@ -371,182 +629,104 @@ class OrderSeeder(BaseSeeder):
             raise ValueError("주문 생성을 위해 먼저 고객, 배송담당자, 상품을 생성해야 합니다.")
 
         if orders_data is None:
-            orders_data = [
-                # 배송 준비 중 (preparing) - 배송담당자 1 (NCR) - 2개
-                {
-                    "customer_index": 0,  # Maria Santos
-                    "partner_name": "조선미녀 필리핀 배송담당자 - NCR",
-                    "items": [
-                        {"product_sku": "JOSEONMINYEO-RICECREAM-50ML", "quantity": 2},
-                    ],
-                    "shipping_fee": Decimal("100"),
-                    "shipping_status": "preparing",
-                    "shipping_commission": Decimal("20"),
-                },
-                {
-                    "customer_index": 1,  # Juan Dela Cruz
-                    "partner_name": "조선미녀 필리핀 배송담당자 - NCR",
-                    "items": [
-                        {"product_sku": "JOSEONMINYEO-RICECREAM-50ML", "quantity": 1},
-                    ],
-                    "shipping_fee": Decimal("100"),
-                    "shipping_status": "preparing",
-                    "shipping_commission": Decimal("20"),
-                },
-                # 배송 중 (in_transit) - 배송담당자 1 (NCR) - 2개
-                {
-                    "customer_index": 2,  # Rosa Garcia
-                    "partner_name": "조선미녀 필리핀 배송담당자 - NCR",
-                    "items": [
-                        {"product_sku": "JOSEONMINYEO-RICECREAM-50ML", "quantity": 1},
-                    ],
-                    "shipping_fee": Decimal("100"),
-                    "shipping_status": "in_transit",
-                    "shipping_commission": Decimal("20"),
-                },
-                {
-                    "customer_index": 0,  # Maria Santos
-                    "partner_name": "조선미녀 필리핀 배송담당자 - NCR",
-                    "items": [
-                        {"product_sku": "JOSEONMINYEO-RICECREAM-50ML", "quantity": 2},
-                    ],
-                    "shipping_fee": Decimal("100"),
-                    "shipping_status": "in_transit",
-                    "shipping_commission": Decimal("20"),
-                },
-                # 배송 완료 (delivered) - 배송담당자 1 (NCR) - 2개
-                {
-                    "customer_index": 1,  # Juan Dela Cruz
-                    "partner_name": "조선미녀 필리핀 배송담당자 - NCR",
-                    "items": [
-                        {"product_sku": "JOSEONMINYEO-RICECREAM-50ML", "quantity": 3},
-                    ],
-                    "shipping_fee": Decimal("100"),
-                    "shipping_status": "delivered",
-                    "shipping_commission": Decimal("20"),
-                },
-                {
-                    "customer_index": 2,  # Rosa Garcia
-                    "partner_name": "조선미녀 필리핀 배송담당자 - NCR",
-                    "items": [
-                        {"product_sku": "JOSEONMINYEO-RICECREAM-50ML", "quantity": 1},
-                    ],
-                    "shipping_fee": Decimal("100"),
-                    "shipping_status": "delivered",
-                    "shipping_commission": Decimal("20"),
-                },
-                # 배송 준비 중 (preparing) - 배송담당자 2 (Visayas)
-                {
-                    "customer_index": 0,  # Maria Santos
-                    "partner_name": "조선미녀 필리핀 배송담당자 - Visayas",
-                    "items": [
-                        {"product_sku": "JOSEONMINYEO-RICECREAM-50ML", "quantity": 2},
-                    ],
-                    "shipping_fee": Decimal("120"),
-                    "shipping_status": "preparing",
-                    "shipping_commission": Decimal("25"),
-                },
-                # 배송 중 (in_transit) - 배송담당자 2 (Visayas)
-                {
-                    "customer_index": 1,  # Juan Dela Cruz
-                    "partner_name": "조선미녀 필리핀 배송담당자 - Visayas",
-                    "items": [
-                        {"product_sku": "JOSEONMINYEO-RICECREAM-50ML", "quantity": 3},
-                    ],
-                    "shipping_fee": Decimal("120"),
-                    "shipping_status": "in_transit",
-                    "shipping_commission": Decimal("25"),
-                },
-                # 배송 완료 (delivered) - 배송담당자 2 (Visayas)
-                {
-                    "customer_index": 2,  # Rosa Garcia
-                    "partner_name": "조선미녀 필리핀 배송담당자 - Visayas",
-                    "items": [
-                        {"product_sku": "JOSEONMINYEO-RICECREAM-50ML", "quantity": 1},
-                    ],
-                    "shipping_fee": Decimal("120"),
-                    "shipping_status": "delivered",
-                    "shipping_commission": Decimal("25"),
-                },
-            ]
+            orders_data = DEFAULT_ORDERS
 
         customers_list = customers_result["data"]
         partners_dict = partners_result["data"]
         products_dict = products_result["data"]
 
+        order_rows = []
+        item_rows = []
         created_orders = []
 
-        for order_data in orders_data:
+        # 루프에서 쓰는 값은 미리 평범한 dict로 펼쳐 둠 (순이윤은 한 번만 변환)
+        id_by_sku = products_result["sku_to_id"]
+        price_by_sku = {sku: product.price for sku, product in products_dict.items()}
+        profit_by_sku = {
+            sku: _dec(product.profit_per_unit or DEFAULT_PROFIT_PER_UNIT)
+            for sku, product in products_dict.items()
+        }
+        partner_id_by_name = {name: partner.id for name, partner in partners_dict.items()}
+        # 합계는 정수(센트)로 누적 후 마지막에 Decimal로 변환
+        price_cents_by_sku = {sku: _to_cents(price) for sku, price in price_by_sku.items()}
+        profit_cents_by_sku = {sku: _to_cents(profit) for sku, profit in profit_by_sku.items()}
+
+        # 모든 주문에 공통인 컬럼 값
+        order_template = {
+            "payment_status": "completed",
+            "paid_at": self.now,
+            "created_at": self.now,
+            "updated_at": self.now,
+        }
+
+        # 주문번호/PayPal ID는 실행마다 다른 토큰 + 순번 (ORD-XXXX0001 형식 유지)
+        run_token = secrets.token_hex(2).upper()
+
+        for seq, order_data in enumerate(orders_data, start=1):
             customer = customers_list[order_data["customer_index"]]
-            partner = partners_dict.get(order_data["partner_name"])
+            partner_id = partner_id_by_name.get(order_data["partner_name"])
 
-            if not partner:
+            if not partner_id:
                 continue
 
-            # 총액 및 순이윤 계산
-            subtotal = Decimal("0")
-            total_profit = Decimal("0")
-            items = []
+            # PK를 미리 생성해 두면 OrderItem 연결을 위해 flush/RETURNING이 필요 없음
+            order_id = uuid4()
+
+            # 총액 및 순이윤 계산 (센트 단위)
+            subtotal_cents = 0
+            total_profit_cents = 0
 
             for item_data in order_data["items"]:
-                product = products_dict.get(item_data["product_sku"])
-                if product:
+                sku = item_data["product_sku"]
+                product_id = id_by_sku.get(sku)
+                if product_id:
                     quantity = item_data["quantity"]
-                    subtotal += product.price * Decimal(str(quantity))
+                    subtotal_cents += price_cents_by_sku[sku] * quantity
 
                     # 순이윤 계산: profit_per_unit * quantity
-                    profit_per_unit = Decimal(str(product.profit_per_unit or 80))
-                    total_profit += profit_per_unit * quantity
+                    total_profit_cents += profit_cents_by_sku[sku] * quantity
 
-                    items.append({
-                        "product": product,
+                    item_rows.append({
+                        "id": uuid4(),
+                        "order_id": order_id,
+                        "product_id": product_id,
                         "quantity": quantity,
-                        "profit_per_unit": profit_per_unit,
+                        "unit_price": price_by_sku[sku],
+                        "profit_per_item": profit_by_sku[sku],
+                        "created_at": self.now,
                     })
 
-            shipping_fee = order_data.get("shipping_fee", Decimal("0"))
+            subtotal = Decimal(subtotal_cents).scaleb(-2)
+            total_profit = Decimal(total_profit_cents).scaleb(-2)
+            shipping_fee = order_data.get("shipping_fee", ZERO)
             total_price = subtotal + shipping_fee
             shipping_status = order_data.get("shipping_status", "preparing")
-            shipping_commission = order_data.get("shipping_commission", Decimal("0"))
-
-            order = Order(
-                id=uuid4(),
-                order_number=f"ORD-{uuid4().hex[:8].upper()}",
-                customer_id=customer.id,
-                fulfillment_partner_id=partner.id,
-                subtotal=subtotal,
-                shipping_fee=shipping_fee,
-                total_price=total_price,
-                payment_status="completed",
-                shipping_status=shipping_status,
-                paypal_order_id=f"PAYPAL-{uuid4().hex[:8].upper()}",
-                paypal_capture_id=f"CAPTURE-{uuid4().hex[:8].upper()}",
-                paypal_transaction_fee=subtotal * Decimal("0.034"),  # 3.4% 수수료
-                total_profit=total_profit,
-                shipping_commission=shipping_commission,
-                paid_at=datetime.utcnow(),
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-            )
-            self.db.add(order)
-            self.flush()
-
-            # OrderItem 생성
-            for item_info in items:
-                order_item = OrderItem(
-                    id=uuid4(),
-                    order_id=order.id,
-                    product_id=item_info["product"].id,
-                    quantity=item_info["quantity"],
-                    unit_price=item_info["product"].price,
-                    profit_per_item=item_info["profit_per_unit"],
-                    created_at=datetime.utcnow(),
-                )
-                self.db.add(order_item)
+            shipping_commission = order_data.get("shipping_commission", ZERO)
+
+            order_row = {
+                **order_template,
+                "id": order_id,
+                "order_number": f"ORD-{run_token}{seq:04d}",
+                "customer_id": customer.id,
+                "fulfillment_partner_id": partner_id,
+                "subtotal": subtotal,
+                "shipping_fee": shipping_fee,
+                "total_price": total_price,
+                "shipping_status": shipping_status,
+                "paypal_order_id": f"PAYPAL-{run_token}{seq:04d}",
+                "paypal_capture_id": f"CAPTURE-{run_token}{seq:04d}",
+                "paypal_transaction_fee": subtotal * PAYPAL_FEE_RATE,
+                "total_profit": total_profit,
+                "shipping_commission": shipping_commission,
+            }
+            order_rows.append(order_row)
+            created_orders.append(SimpleNamespace(**order_row, customer=customer))
 
-            created_orders.append(order)
+        # ORM 객체 생성 없이 주문/주문 항목을 각각 한 번의 executemany로 삽입
+        self._bulk_insert(Order, order_rows)
+        self._bulk_insert(OrderItem, item_rows)
 
-        self.commit()
+        self.flush()
 
         return {
             "type": "orders",
@@ -561,90 +741,83 @@ class AffiliateSeeder(BaseSeeder):
     def seed(self, affiliates_data: List[Dict] = None, orders_result: Dict = None) -> Dict[str, Any]:
         """인플루언서 및 어필리에이트 데이터 생성"""
         if affiliates_data is None:
-            affiliates_data = [
-                {
-                    "email": "influencer1@example.com",
-                    "password": "test123456",
-                    "code": "influencer-no-payment",
-                    "name": "Influencer No Payment",
-                    "has_pending_payment": False,
-                },
-                {
-                    "email": "influencer2@example.com",
-                    "password": "test123456",
-                    "code": "influencer-with-payment",
-                    "name": "Influencer With Payment",
-                    "has_pending_payment": True,
-                },
-            ]
+            affiliates_data = DEFAULT_AFFILIATES
 
         try:
             created_affiliates = []
             credentials = []
+            user_rows = []
+            affiliate_rows = []
+            # 하위 데이터는 모아서 루프 종료 후 테이블별로 한 번에 삽입
+            click_rows = []
+            sale_rows = []
+            payment_rows = []
+            # 클릭 시각 = 30일 전부터 하루에 5건씩 (모든 인플루언서가 같은 목록 공유)
+            base_day = self.now - timedelta(days=30)
+            click_times = [base_day + timedelta(days=i // 5) for i in range(CLICKS_PER_AFFILIATE)]
             orders = orders_result["data"] if orders_result and "data" in orders_result else []
+            password_hashes = _hash_passwords(
+                [affiliate_data["password"] for affiliate_data in affiliates_data]
+            )
 
-            for idx, affiliate_data in enumerate(affiliates_data):
-                # 1. 사용자 생성
-                password_hash = AuthenticationService.hash_password(affiliate_data["password"])
-                user = User(
-                    id=uuid4(),
-                    email=affiliate_data["email"],
-                    password_hash=password_hash,
-                    role="influencer",
-                    is_active=True,
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                )
-                self.db.add(user)
-                self.flush()
+            for affiliate_data, password_hash in zip(affiliates_data, password_hashes):
+                # 1. 사용자 생성 (id를 미리 생성하므로 flush 없이 하위 행에서 참조 가능)
+                user_row = {
+                    "id": uuid4(),
+                    "email": affiliate_data["email"],
+                    "password_hash": password_hash,
+                    "role": "influencer",
+                    "created_at": self.now,
+                    "updated_at": self.now,
+                }
+                user_rows.append(user_row)
 
                 # 2. 어필리에이트 생성
-                affiliate = Affiliate(
-                    id=uuid4(),
-                    user_id=user.id,
-                    code=affiliate_data["code"],
-                    name=affiliate_data["name"],
-                    email=affiliate_data["email"],
-                    is_active=True,
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                )
-                self.db.add(affiliate)
-                self.flush()
+                affiliate_row = {
+                    "id": uuid4(),
+                    "user_id": user_row["id"],
+                    "code": affiliate_data["code"],
+                    "name": affiliate_data["name"],
+                    "email": affiliate_data["email"],
+                    "created_at": self.now,
+                    "updated_at": self.now,
+                }
+                affiliate_rows.append(affiliate_row)
+                affiliate = SimpleNamespace(**affiliate_row)
 
                 # 3. 테스트 클릭 데이터 생성 (150개)
-                for i in range(150):
-                    click = AffiliateClick(
-                        id=uuid4(),
-                        affiliate_id=affiliate.id,
-                        clicked_at=datetime.utcnow() - timedelta(days=30 - (i // 5)),
-                    )
-                    self.db.add(click)
+                click_rows.extend(
+                    {
+                        "id": click_id,
+                        "affiliate_id": affiliate.id,
+                        "clicked_at": clicked_at,
+                    }
+                    for click_id, clicked_at in zip(_uuid_batch(CLICKS_PER_AFFILIATE), click_times)
+                )
 
                 # 4. 지급 예정액이 있는 인플루언서의 경우 판매 데이터 생성
                 if affiliate_data.get("has_pending_payment") and orders:
                     # 처음 3개 주문에 대해 판매 데이터 생성
-                    for order_idx in range(min(3, len(orders))):
-                        sale = AffiliateSale(
-                            id=uuid4(),
-                            affiliate_id=affiliate.id,
-                            order_id=orders[order_idx].id,
-                            marketing_commission=Decimal("15.00"),
-                            created_at=datetime.utcnow(),
-                        )
-                        self.db.add(sale)
+                    sale_rows.extend(
+                        {
+                            "id": uuid4(),
+                            "affiliate_id": affiliate.id,
+                            "order_id": orders[order_idx].id,
+                            "marketing_commission": AFFILIATE_SALE_COMMISSION,
+                            "created_at": self.now,
+                        }
+                        for order_idx in range(min(3, len(orders)))
+                    )
 
                     # 5. 미지급 상태의 지급 데이터 생성 (지급 예정액)
-                    payment = AffiliatePayment(
-                        id=uuid4(),
-                        affiliate_id=affiliate.id,
-                        amount=Decimal("45.00"),
-                        status="pending",
-                        payment_method="PayPal",
-                        created_at=datetime.utcnow(),
-                        updated_at=datetime.utcnow(),
-                    )
-                    self.db.add(payment)
+                    payment_rows.append({
+                        "id": uuid4(),
+                        "affiliate_id": affiliate.id,
+                        "amount": AFFILIATE_PENDING_PAYMENT,
+                        "payment_method": "PayPal",
+                        "created_at": self.now,
+                        "updated_at": self.now,
+                    })
                 else:
                     # 지급 예정액이 없는 경우는 아무것도 하지 않음
                     pass
@@ -653,11 +826,18 @@ class AffiliateSeeder(BaseSeeder):
                 credentials.append({
                     "email": affiliate_data["email"],
                     "password": affiliate_data["password"],
-                    "user_id": str(user.id),
+                    "user_id": str(user_row["id"]),
                     "affiliate_code": affiliate_data["code"],
                 })
 
-            self.commit()
+            # FK 순서대로 테이블별 한 번씩 삽입
+            self._bulk_insert(User, user_rows)
+            self._bulk_insert(Affiliate, affiliate_rows)
+            bulk_copy_or_insert(self.db, AffiliateClick, click_rows)
+            self._bulk_insert(AffiliateSale, sale_rows)
+            self._bulk_insert(AffiliatePayment, payment_rows)
+
+            self.flush()
 
             return {
                 "type": "influencers",
@@ -684,6 +864,7 @@ class ShippingCommissionPaymentSeeder(BaseSeeder):
             raise ValueError("ShippingCommissionPayment 생성을 위해 먼저 FulfillmentPartner를 생성해야 합니다.")
 
         partners_dict = partners_result["data"]
+        rows = []
         created_payments = []
 
         # 배송담당자 1 (NCR)의 처리 주문들로부터 미지급 커미션 계산
@@ -693,24 +874,26 @@ class ShippingCommissionPaymentSeeder(BaseSeeder):
 
             # 배송담당자 1은 preparing과 in_transit 상태의 주문 6개를 처리
             # 각 주문당 20 USD의 커미션 = 총 120 USD의 미지급 커미션
-            total_commission = Decimal("120.00")  # 6개 주문 * 20 USD
-
-            payment = ShippingCommissionPayment(
-                id=uuid4(),
-                fulfillment_partner_id=partner_1.id,
-                amount=total_commission,
-                status="pending",
-                payment_method="PayPal",
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-            )
-            self.db.add(payment)
-            created_payments.append(payment)
+            total_commission = PARTNER_PENDING_COMMISSION
+
+            row = {
+                "id": uuid4(),
+                "fulfillment_partner_id": partner_1.id,
+                "amount": total_commission,
+                "status": "pending",
+                "payment_method": "PayPal",
+                "created_at": self.now,
+                "updated_at": self.now,
+            }
+            rows.append(row)
+            created_payments.append(SimpleNamespace(**row, fulfillment_partner=partner_1))
 
         # 배송담당자 2 (Visayas): 아무 지급 데이터도 생성하지 않음
         # (이미 배송 완료된 주문들이지만, 지급 예정액이 없다는 시나리오)
 
-        self.commit()
+        self._bulk_insert(ShippingCommissionPayment, rows)
+
+        self.flush()
 
         return {
             "type": "shipping_commission_payments",
@@ -735,26 +918,31 @@ class ShipmentSeeder(BaseSeeder):
         orders = orders_result["data"]
         carriers = ["LBC", "2GO", "Grab Express", "Lalamove"]
 
-        created_shipments = []
+        rows = []
+        # 송장번호도 주문번호와 같은 방식 (실행 토큰 + 순번)
+        run_token = secrets.token_hex(2).upper()
 
         for idx, order in enumerate(orders):
             # in_transit 상태인 주문에만 Shipment 생성
             if order.shipping_status == "in_transit":
-                shipment = Shipment(
-                    id=uuid4(),
-                    order_id=order.id,
-                    partner_id=order.fulfillment_partner_id,
-                    carrier=carriers[idx % len(carriers)],
-                    tracking_number=f"{carriers[idx % len(carriers)]}-{uuid4().hex[:8].upper()}",
-                    status="shipped",
-                    shipped_at=datetime.utcnow(),
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                )
-                self.db.add(shipment)
-                created_shipments.append(shipment)
+                carrier = carriers[idx % len(carriers)]
+                rows.append({
+                    "id": uuid4(),
+                    "order_id": order.id,
+                    "partner_id": order.fulfillment_partner_id,
+                    "carrier": carrier,
+                    "tracking_number": f"{carrier}-{run_token}{len(rows) + 1:04d}",
+                    "status": "shipped",
+                    "shipped_at": self.now,
+                    "created_at": self.now,
+                    "updated_at": self.now,
+                })
+
+        self._bulk_insert(Shipment, rows)
 
-        self.commit()
+        self.flush()
+
+        created_shipments = [SimpleNamespace(**row) for row in rows]
 
         return {
             "type": "shipments",
@@ -777,19 +965,26 @@ class RefundSeeder(BaseSeeder):
             raise ValueError("환불 요청 생성을 위해 먼저 Order를 생성해야 합니다.")
 
         orders = orders_result["data"]
-        created_refunds = []
+        refund_values = {
+            "refund_status": "refund_requested",
+            "refund_reason": "상품 불량",
+            "refund_requested_at": self.now,
+        }
 
-        # 배송 완료 상태인 주문들만 처리
-        for idx, order in enumerate(orders):
-            # delivered 상태인 주문만 환불 요청으로 변경
-            if order.shipping_status == "delivered":
-                order.refund_status = "refund_requested"
-                order.refund_reason = "상품 불량"
-                order.refund_requested_at = datetime.utcnow()
-                self.db.add(order)
-                created_refunds.append(order)
-
-        self.commit()
+        # 배송 완료(delivered) 상태인 주문만 환불 요청으로 변경
+        created_refunds = [order for order in orders if order.shipping_status == "delivered"]
+        for order in created_refunds:
+            vars(order).update(refund_values)
+
+        # 모든 대상 주문의 값이 같으므로 IN 조건 UPDATE 한 번으로 처리
+        if created_refunds:
+            self.db.execute(
+                update(Order.__table__)
+                .where(Order.id.in_([order.id for order in created_refunds]))
+                .values(**refund_values)
+            )
+
+        self.flush()
 
         return {
             "type": "refunds",
@@ -83,8 +83,8 @@ def print_console_summary(analyzer, resolver, rule_checker):
     print("\n" + "=" * 80 + "\n")
 
 
-def output_json(analyzer, resolver, rule_checker):
-    """JSON 형식 출력"""
+def output_json(analyzer, resolver, rule_checker, compact: bool = False):
+    """JSON 형식 출력 (compact=True면 들여쓰기/공백 없이 출력)"""
     files_by_layer = analyzer.get_files_by_layer()
     summary = rule_checker.get_summary()
     import_count = resolver.get_import_count_by_layer()
@@ -101,6 +101,9 @@ def output_json(analyzer, resolver, rule_checker):
         "dependency_matrix": resolver.get_layer_dependency_matrix(),
     }
 
+    if compact:
+        return json.dumps(output, ensure_ascii=False, separators=(",", ":"))
+
     return json.dumps(output, indent=2, ensure_ascii=False)
 
 
@@ -125,6 +128,11 @@ def main():
         action="store_true",
         help="검증 결과를 JSON 형식으로 출력",
     )
+    parser.add_argument(
+        "--json-compact",
+        action="store_true",
+        help="검증 결과를 공백 없는 한 줄 JSON으로 출력 (파이프/기계 처리용)",
+    )
     parser.add_argument(
         "--show",
         action="store_true",
@@ -140,6 +148,17 @@ def main():
         default="src",
         help="소스 코드 경로 (기본: src)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="파일 분석 병렬 프로세스 수 (기본: 1, 대규모 코드베이스에서 사용)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="파싱 결과 캐시(.arch_cache/)를 사용하지 않고 모든 파일을 다시 분석",
+    )
 
     args = parser.parse_args()
 
@@ -153,7 +172,11 @@ def main():
 
     # 1. 코드 분석
     print(f"🔍 코드 분석 중... ({args.src_path})")
-    analyzer = ASTAnalyzer(root_path=args.src_path)
+    analyzer = ASTAnalyzer(
+        root_path=args.src_path,
+        jobs=args.jobs,
+        cache_dir=None if args.no_cache else ".arch_cache",
+    )
     files_info = analyzer.analyze()
     print(f"✅ {len(files_info)}개 파일 분석 완료\n")
 
@@ -200,7 +223,9 @@ def main():
     print_console_summary(analyzer, resolver, rule_checker)
 
     # 7. JSON 출력
-    if args.json:
+    if args.json_compact:
+        print(output_json(analyzer, resolver, rule_checker, compact=True))
+    elif args.json:
         print("📊 JSON 형식 출력:\n")
         print(output_json(analyzer, resolver, rule_checker))
 
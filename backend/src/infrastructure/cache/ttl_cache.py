@@ -0,0 +1,47 @@
+"""프로세스 내 TTL 캐시"""
+
+from threading import Lock
+from time import monotonic
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """만료 시간이 있는 프로세스 내 키-값 캐시 (스레드 안전)
+
+    거의 바뀌지 않는 조회 결과를 DB 왕복 없이 재사용할 때 사용한다.
+    세션에 묶이지 않도록 ORM 객체 대신 원시 값만 저장할 것.
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """만료되지 않은 값 조회 (없거나 만료되면 default)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < monotonic():
+            self.invalidate(key)
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """값 저장 (가득 차면 가장 먼저 넣은 항목부터 제거)"""
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (monotonic() + self.ttl_seconds, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        """특정 키 제거 (원본 데이터 변경 시 호출)"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 비우기"""
+        with self._lock:
+            self._entries.clear()
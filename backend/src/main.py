@@ -1,7 +1,10 @@
 """FastAPI 애플리케이션 진입점"""
 
-from fastapi import FastAPI
+import json
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.orm import configure_mappers
 
 from src.config import settings
 from src.presentation.http.routers import admin, auth, customers, orders, shipping, fulfillment_partner, influencer, inquiry
@@ -19,10 +22,15 @@ app = FastAPI(
     debug=settings.DEBUG,
 )
 
+# CORS 허용 도메인 (중복 제거, 프로덕션에서는 로컬 개발 서버 제외)
+cors_origins = [settings.FRONTEND_BASE_URL]
+if settings.ENVIRONMENT != "production" and "http://localhost:3000" not in cors_origins:
+    cors_origins.append("http://localhost:3000")
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:3000", settings.FRONTEND_BASE_URL],
+    allow_origins=cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -38,21 +46,34 @@ app.include_router(fulfillment_partner.router)
 app.include_router(influencer.router)
 app.include_router(inquiry.router)
 
+# ORM 매퍼 설정은 첫 쿼리가 아닌 앱 시작 시 한 번 수행 (관계 설정 오류도 시작 시 감지)
+configure_mappers()
+
+
+def _json_body(content: dict) -> bytes:
+    """JSONResponse와 같은 형식으로 직렬화"""
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# 응답 내용이 고정된 엔드포인트는 시작 시 한 번만 직렬화
+_HEALTH_BODY = _json_body({"status": "ok"})
+_ROOT_BODY = _json_body({
+    "message": "K-Beauty Landing Page API",
+    "version": "0.1.0",
+    "environment": settings.ENVIRONMENT,
+})
+
 
 @app.get("/health")
 async def health_check():
     """헬스 체크"""
-    return {"status": "ok"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/")
 async def root():
     """루트 엔드포인트"""
-    return {
-        "message": "K-Beauty Landing Page API",
-        "version": "0.1.0",
-        "environment": settings.ENVIRONMENT,
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -1,15 +1,43 @@
 """데이터베이스 연결 및 세션 관리"""
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from src.config import settings
 
+database_url = make_url(settings.DATABASE_URL)
+
+# 엔진 옵션 - executemany INSERT는 1000행 단위 multi-row VALUES로 전송
+engine_options = {"insertmanyvalues_page_size": 1000}
+if database_url.get_driver_name() == "psycopg2":
+    # INSERT는 multi-row VALUES, UPDATE/DELETE executemany는 execute_batch로 묶어서 전송
+    engine_options["executemany_mode"] = "values_plus_batch"
+    engine_options["executemany_batch_page_size"] = 500
+
+# 커넥션 풀 옵션 (SQLite는 QueuePool 크기 설정 대상 아님)
+# 워커 하나가 동시에 쓰는 커넥션 수 = 스레드풀에서 동시에 처리 중인 DB 요청 수.
+# 요청당 DB 시간이 ~10ms라면 커넥션 20개로 워커당 ~2000 QPS까지 대기 없이 처리 가능
+pool_options = {}
+if settings.DB_USE_NULL_POOL:
+    # 커넥션 재사용은 PgBouncer가 담당 (앱 프로세스에는 유휴 커넥션을 남기지 않음)
+    pool_options = {"poolclass": NullPool}
+elif database_url.get_backend_name() != "sqlite":
+    pool_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
 # 데이터베이스 엔진 생성
 engine = create_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,
+    echo=settings.SQL_ECHO,
     pool_pre_ping=True,
+    **engine_options,
+    **pool_options,
 )
 
 # 세션 팩토리
@@ -1,7 +1,8 @@
 """SQLAlchemy ORM 모델"""
 
-from datetime import datetime
-from uuid import uuid4
+import os
+import time
+from uuid import UUID as PyUUID, uuid4
 
 from sqlalchemy import (
     Boolean,
@@ -9,17 +10,35 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
     UniqueConstraint,
+    func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
 from src.persistence.database import Base
 
+# 생성/수정 시각은 DB에서 채움 (기존 datetime.utcnow와 같은 UTC naive 값)
+UTC_NOW = func.timezone("utc", func.now())
+
+
+def uuid7() -> PyUUID:
+    """시간순 정렬 UUID (RFC 9562 version 7)
+
+    상위 48비트가 밀리초 타임스탬프라 새 행의 PK가 B-tree 오른쪽 끝에 추가됨
+    (대량 삽입 테이블의 인덱스 페이지 분할 감소). 나머지 비트는 무작위.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return PyUUID(int=value)
+
 
 # ============================================
 # 1. Users (사용자 인증)
@@ -32,8 +51,8 @@ class User(Base):
     password_hash = Column(String(255), nullable=False)
     role = Column(String(50), nullable=False, default="fulfillment_partner")
     is_active = Column(Boolean, default=True, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=UTC_NOW)
 
     # 관계
     fulfillment_partner = relationship("FulfillmentPartner", back_populates="user", uselist=False)
@@ -52,11 +71,11 @@ class Customer(Base):
     phone = Column(String(20))
     address = Column(Text)
     region = Column(String(50))
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=UTC_NOW)
 
     # 관계
-    orders = relationship("Order", back_populates="customer")
+    orders = relationship("Order", back_populates="customer", lazy="raise_on_sql")
 
 
 # ============================================
@@ -74,14 +93,16 @@ class FulfillmentPartner(Base):
     region = Column(String(50))
     is_active = Column(Boolean, default=True, index=True)
     last_allocated_at = Column(DateTime, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=UTC_NOW)
 
     # 관계
     user = relationship("User", back_populates="fulfillment_partner")
-    allocated_inventory = relationship("PartnerAllocatedInventory", back_populates="partner")
-    orders = relationship("Order", back_populates="fulfillment_partner")
-    shipments = relationship("Shipment", back_populates="partner")
+    allocated_inventory = relationship(
+        "PartnerAllocatedInventory", back_populates="partner", lazy="raise_on_sql"
+    )
+    orders = relationship("Order", back_populates="fulfillment_partner", lazy="raise_on_sql")
+    shipments = relationship("Shipment", back_populates="partner", lazy="raise_on_sql")
 
 
 # ============================================
@@ -92,18 +113,21 @@ class Product(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     name = Column(String(255), nullable=False)
-    description = Column(Text)
+    # 목록/주문 처리에서 읽지 않는 긴 텍스트는 접근 시에만 로드
+    description = deferred(Column(Text))
     price = Column(Numeric(10, 2), nullable=False)
     sku = Column(String(100), unique=True)
     image_url = Column(String(500))
     profit_per_unit = Column(Numeric(10, 2), default=80.0)  # 상품 1개당 순이윤
     is_active = Column(Boolean, default=True, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=UTC_NOW)
 
     # 관계
-    allocated_inventory = relationship("PartnerAllocatedInventory", back_populates="product")
-    order_items = relationship("OrderItem", back_populates="product")
+    allocated_inventory = relationship(
+        "PartnerAllocatedInventory", back_populates="product", lazy="raise_on_sql"
+    )
+    order_items = relationship("OrderItem", back_populates="product", lazy="raise_on_sql")
 
 
 # ============================================
@@ -111,7 +135,16 @@ class Product(Base):
 # ============================================
 class PartnerAllocatedInventory(Base):
     __tablename__ = "partner_allocated_inventory"
-    __table_args__ = (UniqueConstraint("partner_id", "product_id"),)
+    __table_args__ = (
+        UniqueConstraint("partner_id", "product_id"),
+        # 상품별 가용 재고 조회 (재고가 남은 행만 인덱싱)
+        Index(
+            "ix_pai_product_remaining",
+            "product_id",
+            "remaining_quantity",
+            postgresql_where=text("remaining_quantity > 0"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     partner_id = Column(UUID(as_uuid=True), ForeignKey("fulfillment_partners.id"), nullable=False, index=True)
@@ -120,8 +153,8 @@ class PartnerAllocatedInventory(Base):
     remaining_quantity = Column(Integer, nullable=False, index=True)
     stock_version = Column(Integer, default=0)
     allocated_date = Column(Date)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=UTC_NOW)
 
     # 관계
     partner = relationship("FulfillmentPartner", back_populates="allocated_inventory")
@@ -141,7 +174,7 @@ class InventoryAdjustmentLog(Base):
     new_quantity = Column(Integer, nullable=False)
     adjusted_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     reason = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW)
 
     # 관계
     inventory = relationship("PartnerAllocatedInventory", back_populates="adjustment_logs")
@@ -153,6 +186,18 @@ class InventoryAdjustmentLog(Base):
 # ============================================
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        # 배송담당자 주문 목록 (결제 완료, 최신순)
+        Index("ix_orders_partner_payment_created", "fulfillment_partner_id", "payment_status", "created_at"),
+        # 결제 상태별 건수/순이윤 합계 (대시보드) - total_profit 포함으로 index-only scan
+        Index("ix_orders_payment_status_profit", "payment_status", postgresql_include=["total_profit"]),
+        # 환불 요청 목록 (요청 최신순) - 환불 관련 주문만 인덱싱
+        Index(
+            "ix_orders_refund_requested",
+            "refund_requested_at",
+            postgresql_where=text("refund_status IS NOT NULL"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     order_number = Column(String(50), unique=True, nullable=False, index=True)
@@ -165,7 +210,7 @@ class Order(Base):
     total_price = Column(Numeric(10, 2), nullable=False)
 
     # 결제 정보
-    payment_status = Column(String(50), default="pending", nullable=False, index=True)
+    payment_status = Column(String(50), default="pending", nullable=False)
     paypal_order_id = Column(String(255))
     paypal_capture_id = Column(String(255))
     paypal_transaction_fee = Column(Numeric(10, 2))
@@ -195,16 +240,18 @@ class Order(Base):
     # 배송 커미션
     shipping_commission = Column(Numeric(10, 2))  # 배송 커미션
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=UTC_NOW)
 
     # 관계
     customer = relationship("Customer", back_populates="orders")
     fulfillment_partner = relationship("FulfillmentPartner", back_populates="orders")
     marketing_affiliate = relationship("Affiliate")
     order_items = relationship("OrderItem", back_populates="order")
-    shipment_allocations = relationship("ShipmentAllocation", back_populates="order")
-    shipments = relationship("Shipment", back_populates="order")
+    shipment_allocations = relationship(
+        "ShipmentAllocation", back_populates="order", lazy="raise_on_sql"
+    )
+    shipments = relationship("Shipment", back_populates="order", lazy="raise_on_sql")
     email_logs = relationship("EmailLog", back_populates="order")
     affiliate_error_logs = relationship("AffiliateErrorLog", back_populates="order")
     affiliate_sales = relationship("AffiliateSale", back_populates="order")
@@ -216,7 +263,7 @@ class Order(Base):
 class OrderItem(Base):
     __tablename__ = "order_items"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     order_id = Column(UUID(as_uuid=True), ForeignKey("orders.id"), nullable=False, index=True)
     product_id = Column(UUID(as_uuid=True), ForeignKey("products.id"), nullable=False)
     quantity = Column(Integer, nullable=False)
@@ -224,7 +271,7 @@ class OrderItem(Base):
     profit_per_item = Column(Numeric(10, 2))  # 상품 1개당 순이윤
     marketing_commission_unit = Column(Numeric(10, 2))  # 아이템당 마케팅 커미션
     shipping_commission_unit = Column(Numeric(10, 2))  # 아이템당 배송 커미션
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW)
 
     # 관계
     order = relationship("Order", back_populates="order_items")
@@ -238,13 +285,13 @@ class OrderItem(Base):
 class ShipmentAllocation(Base):
     __tablename__ = "shipment_allocations"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     order_id = Column(UUID(as_uuid=True), ForeignKey("orders.id"), nullable=False, index=True)
     order_item_id = Column(UUID(as_uuid=True), ForeignKey("order_items.id"), nullable=False)
     partner_id = Column(UUID(as_uuid=True), ForeignKey("fulfillment_partners.id"), nullable=False)
     quantity = Column(Integer, nullable=False)
     shipping_commission = Column(Numeric(10, 2))  # 배송 커미션
-    allocated_at = Column(DateTime, default=datetime.utcnow)
+    allocated_at = Column(DateTime, server_default=UTC_NOW)
 
     # 관계
     order = relationship("Order", back_populates="shipment_allocations")
@@ -266,9 +313,9 @@ class Shipment(Base):
     status = Column(String(50), default="preparing", index=True)
     shipped_at = Column(DateTime)
     delivered_at = Column(DateTime)
-    notes = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    notes = deferred(Column(Text))  # 접근 시에만 로드
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=UTC_NOW)
 
     # 관계
     order = relationship("Order", back_populates="shipments")
@@ -281,14 +328,14 @@ class Shipment(Base):
 class EmailLog(Base):
     __tablename__ = "email_logs"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     order_id = Column(UUID(as_uuid=True), ForeignKey("orders.id"), nullable=False, index=True)
     recipient_email = Column(String(255))
     email_type = Column(String(100))
     status = Column(String(50), index=True)
-    error_message = Column(Text)
+    error_message = deferred(Column(Text))  # 접근 시에만 로드
     sent_at = Column(DateTime)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW)
 
     # 관계
     order = relationship("Order", back_populates="email_logs")
@@ -299,12 +346,16 @@ class EmailLog(Base):
 # ============================================
 class AffiliateSale(Base):
     __tablename__ = "affiliate_sales"
+    __table_args__ = (
+        # 인플루언서별 판매 건수/커미션 합계 (대시보드) - marketing_commission 포함으로 index-only scan
+        Index("ix_affiliate_sales_affiliate_commission", "affiliate_id", postgresql_include=["marketing_commission"]),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    affiliate_id = Column(UUID(as_uuid=True), ForeignKey("affiliates.id"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    affiliate_id = Column(UUID(as_uuid=True), ForeignKey("affiliates.id"), nullable=False)
     order_id = Column(UUID(as_uuid=True), ForeignKey("orders.id"), nullable=False)
     marketing_commission = Column(Numeric(10, 2))  # 마케팅 커미션
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW)
 
     # 관계
     affiliate = relationship("Affiliate", back_populates="sales")
@@ -320,8 +371,8 @@ class ShippingRate(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     region = Column(String(50), unique=True, nullable=False)
     fee = Column(Numeric(10, 2), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=UTC_NOW)
 
 
 # ============================================
@@ -336,8 +387,8 @@ class Affiliate(Base):
     name = Column(String(255))
     email = Column(String(255), unique=True)
     is_active = Column(Boolean, default=True, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=UTC_NOW)
 
     # 관계
     user = relationship("User", back_populates="affiliate")
@@ -358,8 +409,8 @@ class AffiliateErrorLog(Base):
     affiliate_id = Column(UUID(as_uuid=True), ForeignKey("affiliates.id"), index=True)
     affiliate_code = Column(String(100))
     error_type = Column(String(50), nullable=False)  # "INVALID_CODE" / "INACTIVE_AFFILIATE"
-    error_message = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    error_message = deferred(Column(Text))  # 접근 시에만 로드
+    created_at = Column(DateTime, server_default=UTC_NOW)
 
     # 관계
     order = relationship("Order", back_populates="affiliate_error_logs")
@@ -372,9 +423,9 @@ class AffiliateErrorLog(Base):
 class AffiliateClick(Base):
     __tablename__ = "affiliate_clicks"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     affiliate_id = Column(UUID(as_uuid=True), ForeignKey("affiliates.id"), nullable=False, index=True)
-    clicked_at = Column(DateTime, default=datetime.utcnow)
+    clicked_at = Column(DateTime, server_default=UTC_NOW)
 
     # 관계
     affiliate = relationship("Affiliate", back_populates="clicks")
@@ -392,8 +443,8 @@ class AffiliatePayment(Base):
     status = Column(String(50), nullable=False, default="pending")  # pending, completed, failed
     paid_at = Column(DateTime)
     payment_method = Column(String(100))  # PayPal, 은행이체 등
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=UTC_NOW)
 
     # 관계
     affiliate = relationship("Affiliate", back_populates="payments")
@@ -410,7 +461,7 @@ class Settings(Base):
     marketing_commission_rate = Column(Numeric(5, 4), default=0.2)  # 마케팅 커미션율
     shipping_commission_rate = Column(Numeric(5, 4), default=0.2)  # 배송 커미션율
     paypal_transaction_fee_rate = Column(Numeric(5, 4))  # PayPal 거래 수수료율
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=UTC_NOW)
 
 
 # ============================================
@@ -425,8 +476,8 @@ class ShippingCommissionPayment(Base):
     status = Column(String(50), nullable=False, default="pending")  # pending, completed, failed
     paid_at = Column(DateTime)
     payment_method = Column(String(100))  # PayPal, 은행이체 등
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=UTC_NOW)
 
     # 관계
     fulfillment_partner = relationship("FulfillmentPartner")
@@ -444,5 +495,5 @@ class Inquiry(Base):
     reply_to_email = Column(String(255), nullable=False, index=True)  # 회신받을 이메일
     message = Column(Text, nullable=False)  # 문의 내용
     status = Column(String(50), default="unread", index=True)  # "unread", "read"
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW, index=True)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=UTC_NOW)
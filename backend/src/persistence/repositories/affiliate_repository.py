@@ -1,12 +1,30 @@
 """어필리에이트 관련 데이터 접근 계층"""
 
 from decimal import Decimal
+from typing import NamedTuple
 from uuid import UUID
 
+from sqlalchemy import bindparam, insert, select
 from sqlalchemy.orm import Session
 
+from src.infrastructure.cache import TTLCache
 from src.persistence.models import Affiliate, AffiliateErrorLog, AffiliateSale
 
+# 자주 쓰는 조회문은 한 번만 만들어 두고 파라미터만 바꿔 실행 (캐시 키도 재사용)
+_SELECT_AFFILIATE_LOOKUP_BY_CODE = select(Affiliate.id, Affiliate.is_active).where(
+    Affiliate.code == bindparam("code")
+)
+
+# 클릭/주문마다 읽지만 거의 바뀌지 않는 코드 → (id, is_active) 캐시 (60초)
+_affiliate_lookup_cache = TTLCache(ttl_seconds=60)
+
+
+class AffiliateLookup(NamedTuple):
+    """Affiliate 코드 검증에 필요한 값만 담은 캐시용 스냅샷"""
+
+    id: UUID
+    is_active: bool
+
 
 class AffiliateRepository:
     """Affiliate Repository"""
@@ -16,6 +34,33 @@ class AffiliateRepository:
         """Affiliate 코드로 조회"""
         return db.query(Affiliate).filter(Affiliate.code == code).first()
 
+    @staticmethod
+    def get_affiliate_lookup_by_code(db: Session, code: str) -> AffiliateLookup | None:
+        """Affiliate 코드로 (id, is_active) 조회 - 캐시 적중 시 DB 조회 없음
+
+        존재하는 코드만 캐시하므로 새로 생긴 코드는 바로 조회된다.
+        is_active 등 Affiliate를 바꾸는 경로에서는 invalidate_affiliate_code를 호출할 것.
+        """
+        lookup = _affiliate_lookup_cache.get(code)
+        if lookup is not None:
+            return lookup
+
+        row = db.execute(_SELECT_AFFILIATE_LOOKUP_BY_CODE, {"code": code}).first()
+        if row is None:
+            return None
+
+        lookup = AffiliateLookup(id=row.id, is_active=row.is_active)
+        _affiliate_lookup_cache.set(code, lookup)
+        return lookup
+
+    @staticmethod
+    def invalidate_affiliate_code(code: str | None = None) -> None:
+        """Affiliate 코드 캐시 무효화 (code가 없으면 전체)"""
+        if code is None:
+            _affiliate_lookup_cache.clear()
+        else:
+            _affiliate_lookup_cache.invalidate(code)
+
     @staticmethod
     def create_affiliate_error_log(
         db: Session,
@@ -23,17 +68,22 @@ class AffiliateRepository:
         affiliate_code: str,
         error_type: str,
         error_message: str,
+        commit: bool = True,
     ) -> AffiliateErrorLog:
-        """Affiliate Error Log 생성"""
-        error_log = AffiliateErrorLog(
-            order_id=order_id,
-            affiliate_code=affiliate_code,
-            error_type=error_type,
-            error_message=error_message,
-        )
-        db.add(error_log)
-        db.commit()
-        db.refresh(error_log)
+        """Affiliate Error Log 생성 (INSERT ... RETURNING, commit=False면 커밋은 호출자에게 맡김)"""
+        error_log = db.scalars(
+            insert(AffiliateErrorLog).returning(AffiliateErrorLog),
+            [
+                {
+                    "order_id": order_id,
+                    "affiliate_code": affiliate_code,
+                    "error_type": error_type,
+                    "error_message": error_message,
+                }
+            ],
+        ).one()
+        if commit:
+            db.commit()
         return error_log
 
     @staticmethod
@@ -42,14 +92,19 @@ class AffiliateRepository:
         affiliate_id: UUID,
         order_id: UUID,
         marketing_commission: Decimal,
+        commit: bool = True,
     ) -> AffiliateSale:
-        """Affiliate Sale 생성 (마케팅 커미션 기록)"""
-        affiliate_sale = AffiliateSale(
-            affiliate_id=affiliate_id,
-            order_id=order_id,
-            marketing_commission=marketing_commission,
-        )
-        db.add(affiliate_sale)
-        db.commit()
-        db.refresh(affiliate_sale)
+        """Affiliate Sale 생성 (마케팅 커미션 기록, INSERT ... RETURNING, commit=False면 커밋은 호출자에게 맡김)"""
+        affiliate_sale = db.scalars(
+            insert(AffiliateSale).returning(AffiliateSale),
+            [
+                {
+                    "affiliate_id": affiliate_id,
+                    "order_id": order_id,
+                    "marketing_commission": marketing_commission,
+                }
+            ],
+        ).one()
+        if commit:
+            db.commit()
         return affiliate_sale
@@ -1,9 +1,24 @@
 """고객 관련 데이터 접근 계층"""
 
+from sqlalchemy import Row, bindparam, insert, select
 from sqlalchemy.orm import Session
 
 from src.persistence.models import Customer
 
+# 자주 쓰는 조회문은 한 번만 만들어 두고 파라미터만 바꿔 실행 (캐시 키도 재사용)
+_SELECT_CUSTOMER_BY_EMAIL = select(Customer).where(Customer.email == bindparam("email"))
+# 응답 직렬화에 필요한 컬럼만 튜플로 조회 (ORM 객체 생성/identity map 등록 생략)
+_SELECT_CUSTOMER_ROW_BY_EMAIL = select(
+    Customer.id,
+    Customer.email,
+    Customer.name,
+    Customer.phone,
+    Customer.address,
+    Customer.region,
+    Customer.created_at,
+    Customer.updated_at,
+).where(Customer.email == bindparam("email"))
+
 
 class CustomerRepository:
     """Customer Repository"""
@@ -11,12 +26,17 @@ class CustomerRepository:
     @staticmethod
     def get_customer_by_email(db: Session, email: str) -> Customer:
         """이메일로 고객 조회"""
-        return db.query(Customer).filter(Customer.email == email).first()
+        return db.scalars(_SELECT_CUSTOMER_BY_EMAIL, {"email": email}).first()
+
+    @staticmethod
+    def get_customer_by_email_core(db: Session, email: str) -> Row | None:
+        """이메일로 고객 조회 (읽기 전용 - Customer 대신 Row 반환, 수정이 필요하면 get_customer_by_email 사용)"""
+        return db.execute(_SELECT_CUSTOMER_ROW_BY_EMAIL, {"email": email}).first()
 
     @staticmethod
     def get_customer_by_id(db: Session, customer_id: str) -> Customer:
         """ID로 고객 조회"""
-        return db.query(Customer).filter(Customer.id == customer_id).first()
+        return db.get(Customer, customer_id)
 
     @staticmethod
     def create_customer(
@@ -26,18 +46,27 @@ class CustomerRepository:
         phone: str,
         address: str,
         region: str = None,
+        commit: bool = True,
     ) -> Customer:
-        """고객 생성"""
-        customer = Customer(
-            email=email,
-            name=name,
-            phone=phone,
-            address=address,
-            region=region,
-        )
-        db.add(customer)
-        db.commit()
-        db.refresh(customer)
+        """고객 생성 (INSERT ... RETURNING, commit=False면 커밋은 호출자에게 맡김)
+
+        RETURNING 값은 커밋 전까지만 로드된 상태 - commit=True면 커밋 시 만료되어
+        다음 속성 접근 때 다시 SELECT 하므로, 값을 바로 쓸 호출자는 commit=False로 읽은 뒤 커밋할 것
+        """
+        customer = db.scalars(
+            insert(Customer).returning(Customer),
+            [
+                {
+                    "email": email,
+                    "name": name,
+                    "phone": phone,
+                    "address": address,
+                    "region": region,
+                }
+            ],
+        ).one()
+        if commit:
+            db.commit()
         return customer
 
     @staticmethod
@@ -47,7 +76,7 @@ class CustomerRepository:
         **kwargs
     ) -> Customer:
         """고객 정보 업데이트"""
-        customer = db.query(Customer).filter(Customer.id == customer_id).first()
+        customer = db.get(Customer, customer_id)
         if customer:
             for key, value in kwargs.items():
                 if hasattr(customer, key) and value is not None:
@@ -3,6 +3,7 @@
 from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from src.persistence.models import EmailLog
@@ -19,8 +20,9 @@ class EmailLogRepository:
         email_type: str,
         status: str,
         error_message: str | None = None,
+        commit: bool = True,
     ) -> EmailLog:
-        """이메일 로그 생성
+        """이메일 로그 생성 (INSERT ... RETURNING, commit=True면 커밋 시 만료되어 속성 접근 때 다시 SELECT)
 
         Args:
             db: 데이터베이스 세션
@@ -29,21 +31,26 @@ class EmailLogRepository:
             email_type: 이메일 유형 (예: "order_confirmation")
             status: 발송 상태 ("sent" 또는 "failed")
             error_message: 오류 메시지 (발송 실패 시)
+            commit: False면 커밋은 호출자에게 맡김
 
         Returns:
             생성된 EmailLog 객체
         """
-        email_log = EmailLog(
-            order_id=order_id,
-            recipient_email=recipient_email,
-            email_type=email_type,
-            status=status,
-            error_message=error_message,
-            sent_at=datetime.utcnow() if status == "sent" else None,
-        )
-        db.add(email_log)
-        db.commit()
-        db.refresh(email_log)
+        email_log = db.scalars(
+            insert(EmailLog).returning(EmailLog),
+            [
+                {
+                    "order_id": order_id,
+                    "recipient_email": recipient_email,
+                    "email_type": email_type,
+                    "status": status,
+                    "error_message": error_message,
+                    "sent_at": datetime.utcnow() if status == "sent" else None,
+                }
+            ],
+        ).one()
+        if commit:
+            db.commit()
         return email_log
 
     @staticmethod
@@ -1,8 +1,10 @@
 """재고 관련 데이터 접근 계층"""
 
-from typing import Optional
-from uuid import UUID
+from typing import Iterator, Optional
+from uuid import UUID, uuid4
 
+from sqlalchemy import func, insert, literal, select, true, update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from src.persistence.models import (
@@ -19,19 +21,23 @@ class InventoryRepository:
 
     @staticmethod
     def get_total_available_quantity(db: Session, product_id: UUID) -> int:
-        """상품의 총 가용 재고 조회"""
-        inventory_records = db.query(PartnerAllocatedInventory).filter(
+        """상품의 총 가용 재고 조회 (합계는 DB에서 계산)"""
+        total: int = db.query(
+            func.coalesce(func.sum(PartnerAllocatedInventory.remaining_quantity), 0)
+        ).filter(
             PartnerAllocatedInventory.product_id == product_id
-        ).all()
-
-        total: int = sum((record.remaining_quantity for record in inventory_records), 0)
+        ).scalar() or 0
         return total
 
     @staticmethod
     def check_inventory_available(db: Session, product_id: UUID, quantity: int) -> bool:
-        """재고 가용성 확인"""
-        total_available = InventoryRepository.get_total_available_quantity(db, product_id)
-        return total_available >= quantity
+        """재고 가용성 확인 (합계와 비교를 한 쿼리로 DB에서 수행)"""
+        total_available = select(
+            func.coalesce(func.sum(PartnerAllocatedInventory.remaining_quantity), 0)
+        ).where(
+            PartnerAllocatedInventory.product_id == product_id
+        ).scalar_subquery()
+        return bool(db.scalar(select(total_available >= quantity)))
 
     @staticmethod
     def get_partner_inventory(
@@ -82,75 +88,84 @@ class InventoryRepository:
             OrderException: 재고 부족 또는 재시도 초과
         """
         for attempt in range(max_retries):
-            # 1. 현재 재고 조회
-            inventory = db.query(PartnerAllocatedInventory).filter(
+            # 1. 조건부 UPDATE ... RETURNING (재고 확인과 차감을 DB가 원자적으로 수행)
+            updated = db.execute(
+                update(PartnerAllocatedInventory)
+                .where(
+                    PartnerAllocatedInventory.id == inventory_id,
+                    PartnerAllocatedInventory.remaining_quantity >= quantity,
+                )
+                .values(
+                    remaining_quantity=PartnerAllocatedInventory.remaining_quantity - quantity,
+                    stock_version=PartnerAllocatedInventory.stock_version + 1,
+                )
+                .returning(
+                    PartnerAllocatedInventory.remaining_quantity,
+                    PartnerAllocatedInventory.stock_version,
+                )
+            ).one_or_none()
+
+            # 2. UPDATE 성공 확인
+            if updated is not None:
+                db.commit()
+                return {
+                    "success": True,
+                    "remaining_quantity": updated.remaining_quantity,
+                    "new_stock_version": updated.stock_version,
+                }
+
+            # 3. 0행 갱신 → 재고 없음 / 재고 부족 구분을 위해 조회
+            remaining_quantity = db.query(
+                PartnerAllocatedInventory.remaining_quantity
+            ).filter(
                 PartnerAllocatedInventory.id == inventory_id
-            ).first()
+            ).scalar()
 
-            if not inventory:
+            if remaining_quantity is None:
                 raise OrderException(
                     code="INVENTORY_NOT_FOUND",
                     message=f"재고를 찾을 수 없습니다: {inventory_id}",
                 )
 
-            # 2. 재고 확인
-            if inventory.remaining_quantity < quantity:
+            if remaining_quantity < quantity:
                 raise OrderException(
                     code="INSUFFICIENT_STOCK",
-                    message=f"재고가 부족합니다. 보유: {inventory.remaining_quantity}, 필요: {quantity}",
+                    message=f"재고가 부족합니다. 보유: {remaining_quantity}, 필요: {quantity}",
                 )
 
-            # 3. 낙관적 락으로 UPDATE
-            current_version = inventory.stock_version
-            new_remaining = inventory.remaining_quantity - quantity
-            new_version = current_version + 1
-
-            updated_rows = db.query(PartnerAllocatedInventory).filter(
-                PartnerAllocatedInventory.id == inventory_id,
-                PartnerAllocatedInventory.stock_version == current_version,
-            ).update({
-                PartnerAllocatedInventory.remaining_quantity: new_remaining,
-                PartnerAllocatedInventory.stock_version: new_version,
-            })
-
-            db.commit()
+            # 4. 그 사이 재고가 다시 채워짐 → 재시도
 
-            # 4. UPDATE 성공 확인
-            if updated_rows > 0:
-                return {
-                    "success": True,
-                    "remaining_quantity": new_remaining,
-                    "new_stock_version": new_version,
-                }
-
-            # 5. UPDATE 실패 → 재시도
-
-        # 6. 재시도 초과
+        # 5. 재시도 초과
         raise OrderException(
             code="OPTIMISTIC_LOCK_FAILED",
             message=f"재고 업데이트에 실패했습니다. {max_retries}회 재시도 후 포기: {inventory_id}",
         )
 
     @staticmethod
-    def get_all_inventory_by_admin(db: Session) -> list[dict]:
+    def get_all_inventory_by_admin(db: Session, chunk_size: int = 1000) -> Iterator[dict]:
         """
         모든 배송담당자별 재고 조회 (관리자용)
 
-        Returns:
-            [
-                {
-                    "inventory_id": UUID,
-                    "partner_id": UUID,
-                    "partner_name": str,
-                    "product_id": UUID,
-                    "product_name": str,
-                    "current_quantity": int,
-                    "allocated_quantity": int,
-                    "last_adjusted_at": datetime,
-                }
-            ]
+        서버 측 커서로 chunk_size 행씩 받아 한 행씩 내보내므로
+        전체 결과를 한꺼번에 메모리에 올리지 않는다.
+
+        Args:
+            db: 데이터베이스 세션
+            chunk_size: 한 번에 가져올 행 수
+
+        Yields:
+            {
+                "inventory_id": UUID,
+                "partner_id": UUID,
+                "partner_name": str,
+                "product_id": UUID,
+                "product_name": str,
+                "current_quantity": int,
+                "allocated_quantity": int,
+                "last_adjusted_at": datetime,
+            }
         """
-        results = db.query(
+        stmt = select(
             PartnerAllocatedInventory.id.label("inventory_id"),
             PartnerAllocatedInventory.partner_id,
             FulfillmentPartner.name.label("partner_name"),
@@ -166,9 +181,10 @@ class InventoryRepository:
         ).order_by(
             FulfillmentPartner.name,
             Product.name,
-        ).all()
+        )
 
-        return [dict(row._mapping) for row in results]
+        for row in db.execute(stmt).yield_per(chunk_size):
+            yield dict(row._mapping)
 
     @staticmethod
     def get_inventory_adjustment_history(
@@ -240,55 +256,77 @@ class InventoryRepository:
         Raises:
             OrderException: 재고를 찾을 수 없거나 유효성 검사 실패
         """
-        # 1. 재고 조회
-        inventory = db.query(PartnerAllocatedInventory).filter(
-            PartnerAllocatedInventory.id == inventory_id
-        ).first()
-
-        if not inventory:
-            raise OrderException(
-                code="INVENTORY_NOT_FOUND",
-                message=f"재고를 찾을 수 없습니다: {inventory_id}",
-            )
-
-        # 2. 유효성 검사
+        # 1. 유효성 검사
         if new_quantity < 0:
             raise OrderException(
                 code="INVALID_QUANTITY",
                 message="재고 수량은 음수일 수 없습니다",
             )
 
-        old_quantity = inventory.remaining_quantity
+        # 2. 재고 갱신 + 이력 기록을 한 문장(writable CTE)으로 실행
+        #    old: 갱신 전 수량 (FOR UPDATE로 잠가서 동시 조정 시에도 정확한 이전 값)
+        #    upd: UPDATE ... RETURNING 이전 수량 / updated_at
+        #    ins: upd 결과로 이력 INSERT
+        inventory_table = PartnerAllocatedInventory.__table__
+        log_table = InventoryAdjustmentLog.__table__
+
+        old = select(
+            inventory_table.c.id,
+            inventory_table.c.remaining_quantity,
+        ).where(
+            inventory_table.c.id == inventory_id
+        ).with_for_update().subquery("old")
+
+        upd = update(inventory_table).where(
+            inventory_table.c.id == old.c.id
+        ).values(
+            remaining_quantity=new_quantity,
+        ).returning(
+            inventory_table.c.id,
+            old.c.remaining_quantity.label("old_quantity"),
+            inventory_table.c.updated_at,
+        ).cte("upd")
+
+        ins = insert(log_table).from_select(
+            ["id", "inventory_id", "old_quantity", "new_quantity", "adjusted_by", "reason"],
+            select(
+                literal(uuid4(), log_table.c.id.type),
+                upd.c.id,
+                upd.c.old_quantity,
+                literal(new_quantity, log_table.c.new_quantity.type),
+                literal(admin_id, log_table.c.adjusted_by.type),
+                literal(reason, log_table.c.reason.type),
+            ),
+        ).returning(log_table.c.id).cte("ins")
 
-        # 3. 재고 업데이트 (트랜잭션)
         try:
-            inventory.remaining_quantity = new_quantity
-            db.flush()  # 업데이트 먼저 처리
-
-            # 4. 이력 기록 생성
-            adjustment_log = InventoryAdjustmentLog(
-                inventory_id=inventory_id,
-                old_quantity=old_quantity,
-                new_quantity=new_quantity,
-                adjusted_by=admin_id,
-                reason=reason,
-            )
-            db.add(adjustment_log)
-
-            # 5. 커밋
-            db.commit()
-
-            return {
-                "inventory_id": inventory_id,
-                "old_quantity": old_quantity,
-                "new_quantity": new_quantity,
-                "log_id": adjustment_log.id,
-                "updated_at": inventory.updated_at,
-            }
-
-        except Exception as e:
+            row = db.execute(
+                select(
+                    ins.c.id.label("log_id"),
+                    upd.c.old_quantity,
+                    upd.c.updated_at,
+                ).select_from(ins).join(upd, true())
+            ).first()
+        except SQLAlchemyError as e:
             db.rollback()
             raise OrderException(
                 code="INVENTORY_UPDATE_FAILED",
                 message=f"재고 업데이트 중 오류 발생: {str(e)}",
             )
+
+        if row is None:
+            db.rollback()
+            raise OrderException(
+                code="INVENTORY_NOT_FOUND",
+                message=f"재고를 찾을 수 없습니다: {inventory_id}",
+            )
+
+        db.commit()
+
+        return {
+            "inventory_id": inventory_id,
+            "old_quantity": row.old_quantity,
+            "new_quantity": new_quantity,
+            "log_id": row.log_id,
+            "updated_at": row.updated_at,
+        }
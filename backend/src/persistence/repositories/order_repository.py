@@ -1,12 +1,36 @@
 """주문 관련 데이터 접근 계층"""
 
-from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Update, bindparam, insert, select, update
+from sqlalchemy.orm import Session, joinedload, selectinload
 
-from src.persistence.models import Order, OrderItem
+from src.persistence.models import UTC_NOW, Order, OrderItem
+
+# 자주 쓰는 조회문은 한 번만 만들어 두고 파라미터만 바꿔 실행 (캐시 키도 재사용)
+_SELECT_ORDER_BY_NUMBER = select(Order).where(Order.order_number == bindparam("order_number"))
+
+
+def _order_update(**values) -> Update:
+    """id로 주문 한 건을 갱신하고 갱신된 행을 돌려주는 UPDATE ... RETURNING (모듈 로드 시 한 번 생성)"""
+    return update(Order).where(Order.id == bindparam("order_id")).values(**values).returning(Order)
+
+
+_UPDATE_PAYMENT_STATUS = _order_update(payment_status=bindparam("status"))
+_UPDATE_SHIPPING_STATUS = _order_update(shipping_status=bindparam("status"))
+_UPDATE_PAYPAL_ORDER_ID = _order_update(paypal_order_id=bindparam("paypal_id"))
+_UPDATE_CANCELLATION_STATUS = _order_update(
+    cancellation_status=bindparam("status"),
+    cancellation_reason=bindparam("reason"),
+    cancellation_requested_at=UTC_NOW,
+)
+_UPDATE_REFUND_STATUS = _order_update(
+    refund_status=bindparam("status"),
+    refund_reason=bindparam("reason"),
+    refund_requested_at=UTC_NOW,
+)
+_UPDATE_REFUND_DECISION = _order_update(refund_status=bindparam("status"))
 
 
 class OrderRepository:
@@ -15,12 +39,12 @@ class OrderRepository:
     @staticmethod
     def get_order_by_id(db: Session, order_id: UUID) -> Order:
         """ID로 주문 조회"""
-        return db.query(Order).filter(Order.id == order_id).first()
+        return db.get(Order, order_id)
 
     @staticmethod
     def get_order_by_number(db: Session, order_number: str) -> Order:
         """주문 번호로 조회"""
-        return db.query(Order).filter(Order.order_number == order_number).first()
+        return db.scalars(_SELECT_ORDER_BY_NUMBER, {"order_number": order_number}).first()
 
     @staticmethod
     def create_order(
@@ -32,20 +56,28 @@ class OrderRepository:
         total_price: Decimal,
         total_profit: Decimal = None,
         payment_status: str = "pending",
+        commit: bool = True,
     ) -> Order:
-        """주문 생성"""
-        order = Order(
-            order_number=order_number,
-            customer_id=customer_id,
-            subtotal=subtotal,
-            shipping_fee=shipping_fee,
-            total_price=total_price,
-            total_profit=total_profit,
-            payment_status=payment_status,
-        )
-        db.add(order)
-        db.commit()
-        db.refresh(order)
+        """주문 생성 (INSERT ... RETURNING, commit=False면 커밋은 호출자에게 맡김)
+
+        RETURNING 값은 커밋 전까지만 로드된 상태 - commit=True면 커밋 시 만료되어 다음 속성 접근 때 다시 SELECT
+        """
+        order = db.scalars(
+            insert(Order).returning(Order),
+            [
+                {
+                    "order_number": order_number,
+                    "customer_id": customer_id,
+                    "subtotal": subtotal,
+                    "shipping_fee": shipping_fee,
+                    "total_price": total_price,
+                    "total_profit": total_profit,
+                    "payment_status": payment_status,
+                }
+            ],
+        ).one()
+        if commit:
+            db.commit()
         return order
 
     @staticmethod
@@ -56,19 +88,112 @@ class OrderRepository:
         quantity: int,
         unit_price: Decimal,
         profit_per_item: Decimal = None,
+        commit: bool = True,
     ) -> OrderItem:
-        """주문 상품 추가"""
-        order_item = OrderItem(
+        """주문 상품 추가 (commit=False면 커밋은 호출자에게 맡김)"""
+        return OrderRepository.add_order_items_bulk(
+            db,
             order_id=order_id,
-            product_id=product_id,
-            quantity=quantity,
-            unit_price=unit_price,
-            profit_per_item=profit_per_item,
+            items=[
+                {
+                    "product_id": product_id,
+                    "quantity": quantity,
+                    "unit_price": unit_price,
+                    "profit_per_item": profit_per_item,
+                }
+            ],
+            commit=commit,
+        )[0]
+
+    @staticmethod
+    def add_order_items_bulk(
+        db: Session,
+        order_id: UUID,
+        items: list[dict],
+        commit: bool = True,
+    ) -> list[OrderItem]:
+        """
+        주문 상품 일괄 추가 (장바구니 전체를 INSERT ... RETURNING 한 번으로)
+
+        Args:
+            db: 데이터베이스 세션
+            order_id: 주문 ID
+            items: product_id, quantity, unit_price, profit_per_item(선택) 키의 dict 리스트
+            commit: False면 커밋은 호출자에게 맡김
+
+        Returns:
+            items 순서대로 생성된 OrderItem 리스트
+        """
+        if not items:
+            return []
+
+        order_items = db.scalars(
+            insert(OrderItem).returning(OrderItem, sort_by_parameter_order=True),
+            [
+                {
+                    "order_id": order_id,
+                    "product_id": item["product_id"],
+                    "quantity": item["quantity"],
+                    "unit_price": item["unit_price"],
+                    "profit_per_item": item.get("profit_per_item"),
+                }
+                for item in items
+            ],
+        ).all()
+        if commit:
+            db.commit()
+        return list(order_items)
+
+    @staticmethod
+    def create_order_with_items(
+        db: Session,
+        order_number: str,
+        customer_id: UUID,
+        subtotal: Decimal,
+        shipping_fee: Decimal,
+        total_price: Decimal,
+        items: list[dict],
+        total_profit: Decimal = None,
+        payment_status: str = "pending",
+    ) -> tuple[Order, list[OrderItem]]:
+        """
+        주문과 주문 상품을 한 트랜잭션으로 생성 (INSERT 두 번 + COMMIT 한 번)
+
+        Args:
+            db: 데이터베이스 세션
+            order_number: 주문 번호
+            customer_id: 고객 ID
+            subtotal: 상품 금액 합계
+            shipping_fee: 배송료
+            total_price: 총 결제 금액
+            items: add_order_items_bulk 와 같은 형식의 dict 리스트
+            total_profit: 총 순이윤
+            payment_status: 결제 상태
+
+        Returns:
+            (생성된 Order, items 순서대로 생성된 OrderItem 리스트)
+        """
+        order = OrderRepository.create_order(
+            db,
+            order_number=order_number,
+            customer_id=customer_id,
+            subtotal=subtotal,
+            shipping_fee=shipping_fee,
+            total_price=total_price,
+            total_profit=total_profit,
+            payment_status=payment_status,
+            commit=False,
         )
-        db.add(order_item)
+        order_items = OrderRepository.add_order_items_bulk(db, order_id=order.id, items=items, commit=False)
         db.commit()
-        db.refresh(order_item)
-        return order_item
+        return order, order_items
+
+    @staticmethod
+    def _update_order(db: Session, stmt: Update, params: dict) -> Order | None:
+        """미리 만들어 둔 주문 UPDATE 실행 - 먼저 SELECT 하지 않고 갱신된 행을 RETURNING 으로 받음"""
+        order = db.scalars(stmt, params).one_or_none()
+        db.commit()
+        return order
 
     @staticmethod
     def update_payment_status(
@@ -76,13 +201,10 @@ class OrderRepository:
         order_id: UUID,
         payment_status: str,
     ) -> Order:
-        """주문 결제 상태 업데이트"""
-        order = db.query(Order).filter(Order.id == order_id).first()
-        if order:
-            order.payment_status = payment_status
-            db.commit()
-            db.refresh(order)
-        return order
+        """주문 결제 상태 업데이트 (UPDATE ... RETURNING 한 번)"""
+        return OrderRepository._update_order(
+            db, _UPDATE_PAYMENT_STATUS, {"order_id": order_id, "status": payment_status}
+        )
 
     @staticmethod
     def update_shipping_status(
@@ -90,13 +212,10 @@ class OrderRepository:
         order_id: UUID,
         shipping_status: str,
     ) -> Order:
-        """주문 배송 상태 업데이트"""
-        order = db.query(Order).filter(Order.id == order_id).first()
-        if order:
-            order.shipping_status = shipping_status
-            db.commit()
-            db.refresh(order)
-        return order
+        """주문 배송 상태 업데이트 (UPDATE ... RETURNING 한 번)"""
+        return OrderRepository._update_order(
+            db, _UPDATE_SHIPPING_STATUS, {"order_id": order_id, "status": shipping_status}
+        )
 
     @staticmethod
     def update_order_status(
@@ -113,13 +232,10 @@ class OrderRepository:
         order_id: UUID,
         paypal_order_id: str,
     ) -> Order:
-        """주문의 PayPal 주문 ID 저장"""
-        order = db.query(Order).filter(Order.id == order_id).first()
-        if order:
-            order.paypal_order_id = paypal_order_id
-            db.commit()
-            db.refresh(order)
-        return order
+        """주문의 PayPal 주문 ID 저장 (UPDATE ... RETURNING 한 번)"""
+        return OrderRepository._update_order(
+            db, _UPDATE_PAYPAL_ORDER_ID, {"order_id": order_id, "paypal_id": paypal_order_id}
+        )
 
     @staticmethod
     def update_cancellation_status(
@@ -128,15 +244,10 @@ class OrderRepository:
         status: str,
         reason: str = None,
     ) -> Order:
-        """주문 취소 상태 업데이트"""
-        order = db.query(Order).filter(Order.id == order_id).first()
-        if order:
-            order.cancellation_status = status
-            order.cancellation_reason = reason
-            order.cancellation_requested_at = datetime.utcnow()
-            db.commit()
-            db.refresh(order)
-        return order
+        """주문 취소 상태 업데이트 (UPDATE ... RETURNING 한 번)"""
+        return OrderRepository._update_order(
+            db, _UPDATE_CANCELLATION_STATUS, {"order_id": order_id, "status": status, "reason": reason}
+        )
 
     @staticmethod
     def update_refund_status(
@@ -145,15 +256,10 @@ class OrderRepository:
         status: str,
         reason: str = None,
     ) -> Order:
-        """주문 환불 상태 업데이트"""
-        order = db.query(Order).filter(Order.id == order_id).first()
-        if order:
-            order.refund_status = status
-            order.refund_reason = reason
-            order.refund_requested_at = datetime.utcnow()
-            db.commit()
-            db.refresh(order)
-        return order
+        """주문 환불 상태 업데이트 (UPDATE ... RETURNING 한 번)"""
+        return OrderRepository._update_order(
+            db, _UPDATE_REFUND_STATUS, {"order_id": order_id, "status": status, "reason": reason}
+        )
 
     @staticmethod
     def get_orders_by_fulfillment_partner(
@@ -176,7 +282,11 @@ class OrderRepository:
         Returns:
             조건을 만족하는 Order 리스트
         """
-        orders = db.query(Order).filter(
+        # 응답에서 고객/주문상품/상품을 모두 읽으므로 함께 로드 (주문마다 lazy load 하는 N+1 방지)
+        orders = db.query(Order).options(
+            joinedload(Order.customer),
+            selectinload(Order.order_items).joinedload(OrderItem.product),
+        ).filter(
             Order.fulfillment_partner_id == fulfillment_partner_id,
             Order.payment_status == "completed",
         ).order_by(
@@ -201,7 +311,10 @@ class OrderRepository:
         Returns:
             환불 관련 주문 리스트
         """
-        orders = db.query(Order).filter(
+        # 목록에 고객 이름을 표시하므로 고객을 JOIN 으로 함께 로드
+        orders = db.query(Order).options(
+            joinedload(Order.customer),
+        ).filter(
             Order.refund_status.isnot(None)
         ).order_by(
             Order.refund_requested_at.desc()
@@ -213,23 +326,17 @@ class OrderRepository:
         db: Session,
         order_id: UUID,
     ) -> Order:
-        """환불 승인"""
-        order = db.query(Order).filter(Order.id == order_id).first()
-        if order:
-            order.refund_status = "refunded"
-            db.commit()
-            db.refresh(order)
-        return order
+        """환불 승인 (UPDATE ... RETURNING 한 번)"""
+        return OrderRepository._update_order(
+            db, _UPDATE_REFUND_DECISION, {"order_id": order_id, "status": "refunded"}
+        )
 
     @staticmethod
     def reject_refund(
         db: Session,
         order_id: UUID,
     ) -> Order:
-        """환불 거절"""
-        order = db.query(Order).filter(Order.id == order_id).first()
-        if order:
-            order.refund_status = "refund_rejected"
-            db.commit()
-            db.refresh(order)
-        return order
+        """환불 거절 (UPDATE ... RETURNING 한 번)"""
+        return OrderRepository._update_order(
+            db, _UPDATE_REFUND_DECISION, {"order_id": order_id, "status": "refund_rejected"}
+        )
@@ -1,11 +1,27 @@
 """사용자 저장소 - Data Access Layer"""
 
+from typing import NamedTuple
 from uuid import UUID
+
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
+from ...infrastructure.cache import TTLCache
 from ..models import User as UserORM
 from ...workflow.domain.models import User as UserDomain, UserRole
 
+_SELECT_USER_ROLE_BY_ID = select(UserORM.role).where(UserORM.id == bindparam("user_id"))
+
+# 관리자 API 요청마다 인증에서 읽는 사용자 역할 캐시 (30초) - 토큰 검증은 매 요청 수행
+_user_principal_cache = TTLCache(ttl_seconds=30)
+
+
+class UserPrincipal(NamedTuple):
+    """인증된 요청의 사용자 식별 정보 (캐시용 스냅샷)"""
+
+    id: UUID
+    role: str
+
 
 class UserRepository:
     """사용자 저장소 - Domain ↔ ORM 변환"""
@@ -31,6 +47,33 @@ class UserRepository:
 
         return UserRepository._orm_to_domain(user_orm)
 
+    @staticmethod
+    def get_user_principal_by_id(db: Session, user_id: UUID | str) -> UserPrincipal | None:
+        """ID로 (id, role) 조회 - 캐시 적중 시 DB 조회 없음
+
+        존재하는 사용자만 캐시한다. 역할 변경 등 사용자를 바꾸는 경로에서는 invalidate_user를 호출할 것.
+        """
+        key = str(user_id)
+        principal = _user_principal_cache.get(key)
+        if principal is not None:
+            return principal
+
+        role = db.scalar(_SELECT_USER_ROLE_BY_ID, {"user_id": user_id})
+        if role is None:
+            return None
+
+        principal = UserPrincipal(id=UUID(key), role=role)
+        _user_principal_cache.set(key, principal)
+        return principal
+
+    @staticmethod
+    def invalidate_user(user_id: UUID | str | None = None) -> None:
+        """사용자 캐시 무효화 (user_id가 없으면 전체)"""
+        if user_id is None:
+            _user_principal_cache.clear()
+        else:
+            _user_principal_cache.invalidate(str(user_id))
+
     @staticmethod
     def create_user(
         db: Session,
@@ -69,6 +112,7 @@ class UserRepository:
         user_orm.password_hash = password_hash
         db.commit()
         db.refresh(user_orm)
+        UserRepository.invalidate_user(user_id)
 
         return UserRepository._orm_to_domain(user_orm)
 
@@ -10,9 +10,10 @@ from uuid import UUID
 logger = logging.getLogger(__name__)
 
 from ....persistence.database import get_db
-from ....persistence.models import User, Shipment, Order, Customer, Affiliate, FulfillmentPartner, AffiliateSale, AffiliatePayment, ShipmentAllocation, ShippingCommissionPayment
+from ....persistence.models import Shipment, Order, Customer, Affiliate, FulfillmentPartner, AffiliateSale, AffiliatePayment, ShipmentAllocation, ShippingCommissionPayment
 from ....persistence.repositories.inventory_repository import InventoryRepository
 from ....persistence.repositories.order_repository import OrderRepository
+from ....persistence.repositories.user_repository import UserPrincipal, UserRepository
 from ....workflow.services.admin_service import AdminService
 from ....workflow.services.shipment_service import ShipmentService
 from ....infrastructure.auth import JWTTokenManager
@@ -49,7 +50,7 @@ router = APIRouter(prefix="/api/admin", tags=["Admin"])
 def get_current_admin(
     authorization: str = Header(None),
     db: Session = Depends(get_db),
-) -> User:
+) -> UserPrincipal:
     """
     현재 관리자 인증 확인
 
@@ -58,7 +59,7 @@ def get_current_admin(
         db: 데이터베이스 세션
 
     Returns:
-        현재 사용자의 User 객체 (role == "admin")
+        현재 사용자의 (id, role) (role == "admin", 사용자 조회는 30초 캐시)
 
     Raises:
         HTTPException: 토큰 없음, 유효하지 않음, 관리자 아님
@@ -99,7 +100,7 @@ def get_current_admin(
 
     # 사용자 조회
     user_id = payload.get("user_id")
-    user = db.query(User).filter(User.id == user_id).first()
+    user = UserRepository.get_user_principal_by_id(db, user_id)
 
     if not user:
         raise HTTPException(
@@ -124,9 +125,9 @@ def get_current_admin(
 
 
 @router.post("/users", response_model=CreateUserResponse)
-async def create_user(
+def create_user(
     request: CreateUserRequest,
-    current_admin: User = Depends(get_current_admin),
+    current_admin: UserPrincipal = Depends(get_current_admin),
     db: Session = Depends(get_db),
 ):
     """사용자 생성 (배송담당자, 인플루언서) - 관리자 전용"""
@@ -160,8 +161,8 @@ async def create_user(
 # ============================================
 
 @router.get("/inventory", response_model=InventoryListResponse)
-async def get_inventory(
-    current_admin: User = Depends(get_current_admin),
+def get_inventory(
+    current_admin: UserPrincipal = Depends(get_current_admin),
     db: Session = Depends(get_db),
 ):
     """
@@ -172,10 +173,13 @@ async def get_inventory(
         - total_count: 전체 재고 항목 수
     """
     try:
-        inventories = InventoryRepository.get_all_inventory_by_admin(db)
+        inventories = [
+            InventoryItem(**item)
+            for item in InventoryRepository.get_all_inventory_by_admin(db)
+        ]
 
         return {
-            "inventories": [InventoryItem(**item) for item in inventories],
+            "inventories": inventories,
             "total_count": len(inventories),
         }
     except Exception as e:
@@ -189,10 +193,10 @@ async def get_inventory(
 
 
 @router.put("/inventory/{inventory_id}", response_model=AdjustInventoryResponse)
-async def adjust_inventory(
+def adjust_inventory(
     inventory_id: UUID,
     request: AdjustInventoryRequest,
-    current_admin: User = Depends(get_current_admin),
+    current_admin: UserPrincipal = Depends(get_current_admin),
     db: Session = Depends(get_db),
 ):
     """
@@ -241,10 +245,10 @@ async def adjust_inventory(
 
 
 @router.get("/inventory/{inventory_id}/history", response_model=InventoryHistoryResponse)
-async def get_inventory_history(
+def get_inventory_history(
     inventory_id: UUID,
     limit: int = 10,
-    current_admin: User = Depends(get_current_admin),
+    current_admin: UserPrincipal = Depends(get_current_admin),
     db: Session = Depends(get_db),
 ):
     """
@@ -322,8 +326,8 @@ async def get_inventory_history(
 # ============================================
 
 @router.get("/shipments", response_model=ShipmentListResponse)
-async def get_shipments(
-    current_admin: User = Depends(get_current_admin),
+def get_shipments(
+    current_admin: UserPrincipal = Depends(get_current_admin),
     db: Session = Depends(get_db),
 ):
     """
@@ -379,9 +383,9 @@ async def get_shipments(
 
 
 @router.patch("/shipments/{shipment_id}/complete", response_model=CompleteShipmentResponse)
-async def complete_shipment(
+def complete_shipment(
     shipment_id: UUID,
-    current_admin: User = Depends(get_current_admin),
+    current_admin: UserPrincipal = Depends(get_current_admin),
     db: Session = Depends(get_db),
 ):
     """
@@ -439,8 +443,8 @@ async def complete_shipment(
 # ============================================
 
 @router.get("/refunds", response_model=RefundListResponse)
-async def get_refund_requests(
-    current_admin: User = Depends(get_current_admin),
+def get_refund_requests(
+    current_admin: UserPrincipal = Depends(get_current_admin),
     db: Session = Depends(get_db),
 ):
     """
@@ -451,22 +455,16 @@ async def get_refund_requests(
         - total_count: 전체 환불 요청 수
     """
     try:
-        orders = (
-            db.query(Order, Customer)
-            .join(Customer, Order.customer_id == Customer.id)
-            .filter(Order.refund_status.isnot(None))
-            .order_by(Order.refund_requested_at.desc())
-            .all()
-        )
+        orders = OrderRepository.get_refund_requests(db)
 
         refund_items = []
-        for order, customer in orders:
+        for order in orders:
             refund_items.append(
                 RefundItem(
                     refund_id=f"REF-{order.order_number.split('-')[1]}",
                     order_id=order.id,
                     order_number=order.order_number,
-                    customer_name=customer.name,
+                    customer_name=order.customer.name,
                     total_price=float(order.total_price),
                     refund_reason=order.refund_reason or "미입력",
                     refund_status=order.refund_status,
@@ -490,10 +488,10 @@ async def get_refund_requests(
 
 
 @router.patch("/refunds/{order_id}/process", response_model=ProcessRefundResponse)
-async def process_refund(
+def process_refund(
     order_id: UUID,
     request: ProcessRefundRequest,
-    current_admin: User = Depends(get_current_admin),
+    current_admin: UserPrincipal = Depends(get_current_admin),
     db: Session = Depends(get_db),
 ):
     """
@@ -566,8 +564,8 @@ async def process_refund(
 # 관리자 대시보드
 # ============================================
 @router.get("/dashboard", response_model=AdminDashboardResponse)
-async def get_admin_dashboard(
-    current_admin: User = Depends(get_current_admin),
+def get_admin_dashboard(
+    current_admin: UserPrincipal = Depends(get_current_admin),
     db: Session = Depends(get_db),
 ):
     """
@@ -86,7 +86,7 @@ def get_current_user(
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(
+def login(
     credentials: LoginRequest,
     db: Session = Depends(get_db),
 ):
@@ -142,7 +142,7 @@ async def login(
 
 
 @router.get("/me", response_model=CurrentUserResponse)
-async def get_current_user_info(
+def get_current_user_info(
     authorization: str = Header(None),
 ):
     """
@@ -199,7 +199,7 @@ async def get_current_user_info(
 
 
 @router.post("/change-password", response_model=ChangePasswordResponse)
-async def change_password(
+def change_password(
     request: ChangePasswordRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -259,7 +259,7 @@ async def change_password(
 
 
 @router.get("/test-accounts", response_model=List[TestAccountResponse])
-async def get_test_accounts(db: Session = Depends(get_db)):
+def get_test_accounts(db: Session = Depends(get_db)):
     """
     현재 등록된 테스트 계정 조회 (배송담당자, 인플루언서)
 
@@ -13,20 +13,20 @@ router = APIRouter(prefix="/api/customers", tags=["customers"])
 
 
 @router.post("", response_model=CustomerResponse)
-async def create_customer(
+def create_customer(
     customer_data: CustomerCreate,
     db: Session = Depends(get_db),
 ):
     """고객 생성"""
     logger.info(f"고객 생성 요청: {customer_data.model_dump()}")
 
-    # 기존 고객이 있는지 확인
-    existing_customer = CustomerRepository.get_customer_by_email(db, customer_data.email)
+    # 기존 고객이 있는지 확인 (응답으로만 쓰이므로 ORM 객체 없이 Row로 조회)
+    existing_customer = CustomerRepository.get_customer_by_email_core(db, customer_data.email)
     if existing_customer:
         logger.info(f"기존 고객 반환: {existing_customer.id}")
         return existing_customer
 
-    # 새로운 고객 생성
+    # 새로운 고객 생성 - RETURNING 으로 받은 값이 커밋으로 만료되기 전에 응답을 만듦 (재조회 없음)
     customer = CustomerRepository.create_customer(
         db,
         email=customer_data.email,
@@ -34,6 +34,9 @@ async def create_customer(
         phone=customer_data.phone,
         address=customer_data.address,
         region=customer_data.region,
+        commit=False,
     )
-    logger.info(f"새로운 고객 생성: {customer.id}")
-    return customer
+    response = CustomerResponse.model_validate(customer)
+    db.commit()
+    logger.info(f"새로운 고객 생성: {response.id}")
+    return response
@@ -103,7 +103,7 @@ def get_current_fulfillment_partner(
 
 
 @router.get("/orders", response_model=FulfillmentPartnerOrdersListResponse)
-async def get_fulfillment_partner_orders(
+def get_fulfillment_partner_orders(
     current_partner: FulfillmentPartner = Depends(get_current_fulfillment_partner),
     db: Session = Depends(get_db),
 ):
@@ -183,7 +183,7 @@ async def get_fulfillment_partner_orders(
 
 
 @router.patch("/orders/{order_id}/ship", response_model=ShipmentResponse)
-async def process_shipment(
+def process_shipment(
     order_id: UUID,
     shipment_data: ShipmentRequest,
     current_partner: FulfillmentPartner = Depends(get_current_fulfillment_partner),
@@ -275,7 +275,7 @@ async def process_shipment(
 
 
 @router.patch("/orders/{order_id}/complete", response_model=CompleteShipmentResponse)
-async def complete_delivery(
+def complete_delivery(
     order_id: UUID,
     current_partner: FulfillmentPartner = Depends(get_current_fulfillment_partner),
     db: Session = Depends(get_db),
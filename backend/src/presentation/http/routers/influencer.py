@@ -7,6 +7,7 @@ from decimal import Decimal
 
 from src.persistence.database import get_db
 from src.persistence.models import User, Affiliate, AffiliateClick, AffiliatePayment
+from src.persistence.repositories.affiliate_repository import AffiliateRepository
 from src.presentation.schemas.influencer import (
     InfluencerDashboardResponse,
     AffiliateClickRequest,
@@ -98,7 +99,7 @@ def get_current_influencer(
 
 
 @router.get("/dashboard", response_model=InfluencerDashboardResponse)
-async def get_influencer_dashboard(
+def get_influencer_dashboard(
     current_affiliate: Affiliate = Depends(get_current_influencer),
     db: Session = Depends(get_db),
 ):
@@ -158,7 +159,7 @@ async def get_influencer_dashboard(
 
 
 @router.post("/click", response_model=AffiliateClickResponse)
-async def track_affiliate_click(
+def track_affiliate_click(
     request: AffiliateClickRequest,
     db: Session = Depends(get_db),
 ):
@@ -177,10 +178,8 @@ async def track_affiliate_click(
     }
     """
     try:
-        # 1. 어필리에이트 코드로 조회
-        affiliate = db.query(Affiliate).filter(
-            Affiliate.code == request.code
-        ).first()
+        # 1. 어필리에이트 코드로 (id, is_active) 조회 (클릭마다 호출되므로 캐시 사용)
+        affiliate = AffiliateRepository.get_affiliate_lookup_by_code(db, request.code)
 
         if not affiliate:
             return AffiliateClickResponse(
@@ -121,7 +121,7 @@ def get_optional_user(
 
 
 @router.post("", response_model=InquiryResponse)
-async def create_inquiry(
+def create_inquiry(
     request: InquiryRequest,
     current_user: User | None = Depends(get_optional_user),
     db: Session = Depends(get_db),
@@ -207,7 +207,7 @@ async def create_inquiry(
 
 
 @router.get("/admin/list", response_model=InquiryListResponse)
-async def get_inquiries(
+def get_inquiries(
     page: int = 1,
     page_size: int = 20,
     inquiry_type: str | None = None,
@@ -284,7 +284,7 @@ async def get_inquiries(
 
 
 @router.patch("/admin/{inquiry_id}/status", response_model=InquiryDetailResponse)
-async def update_inquiry_status(
+def update_inquiry_status(
     inquiry_id: str,
     request: InquiryStatusUpdateRequest,
     current_user: User = Depends(get_current_user),
@@ -13,7 +13,7 @@ router = APIRouter(prefix="/api/orders", tags=["orders"])
 
 
 @router.post("", response_model=OrderResponse)
-async def create_order(
+def create_order(
     order_data: OrderCreate,
     db: Session = Depends(get_db),
 ):
@@ -53,7 +53,7 @@ async def create_order(
 
 
 @router.get("/{order_number}", response_model=OrderResponse)
-async def get_order(
+def get_order(
     order_number: str,
     email: str = None,
     db: Session = Depends(get_db),
@@ -106,7 +106,7 @@ async def get_order(
 
 
 @router.post("/{order_id}/initiate-payment")
-async def initiate_payment(
+def initiate_payment(
     order_id: str,
     db: Session = Depends(get_db),
 ):
@@ -159,7 +159,7 @@ async def initiate_payment(
 
 
 @router.post("/{order_number}/cancel-request", response_model=OrderResponse)
-async def request_cancellation(
+def request_cancellation(
     order_number: str,
     request_data: CancellationRefundRequest,
     db: Session = Depends(get_db),
@@ -197,7 +197,7 @@ async def request_cancellation(
 
 
 @router.post("/{order_number}/refund-request", response_model=OrderResponse)
-async def request_refund(
+def request_refund(
     order_number: str,
     request_data: CancellationRefundRequest,
     db: Session = Depends(get_db),
@@ -13,14 +13,14 @@ router = APIRouter(prefix="/api/shipping-rates", tags=["shipping"])
 
 
 @router.get("", response_model=List[ShippingRateResponse])
-async def get_all_shipping_rates(db: Session = Depends(get_db)):
+def get_all_shipping_rates(db: Session = Depends(get_db)):
     """모든 배송료 조회"""
     rates = ShippingRepository.get_all_shipping_rates(db)
     return rates
 
 
 @router.get("/{region}", response_model=ShippingRateResponse)
-async def get_shipping_rate(region: str, db: Session = Depends(get_db)):
+def get_shipping_rate(region: str, db: Session = Depends(get_db)):
     """지역별 배송료 조회"""
     rate = ShippingRepository.get_shipping_rate_by_region(db, region)
     if not rate:
@@ -29,7 +29,7 @@ async def get_shipping_rate(region: str, db: Session = Depends(get_db)):
 
 
 @router.put("/{region}", response_model=ShippingRateResponse)
-async def update_shipping_rate(
+def update_shipping_rate(
     region: str,
     update_data: ShippingRateUpdate,
     db: Session = Depends(get_db),
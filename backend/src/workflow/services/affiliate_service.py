@@ -92,8 +92,8 @@ class AffiliateService:
         if not affiliate_code:
             return None
 
-        # 2. Affiliate 코드로 조회
-        affiliate = AffiliateRepository.get_affiliate_by_code(db, affiliate_code)
+        # 2. Affiliate 코드로 조회 (id, is_active만 필요 → 캐시 사용)
+        affiliate = AffiliateRepository.get_affiliate_lookup_by_code(db, affiliate_code)
 
         # 3. Affiliate가 없으면 오류 기록
         if not affiliate:
@@ -5,8 +5,8 @@ from decimal import Decimal
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import case
-from sqlalchemy.orm import Session
+from sqlalchemy import case, insert
+from sqlalchemy.orm import Session, load_only
 
 from src.persistence.models import (
     FulfillmentPartner,
@@ -145,7 +145,10 @@ class FulfillmentService:
         selected_partner: Optional[FulfillmentPartner] = None
         selected_inventory: Optional[PartnerAllocatedInventory] = None
         for partner in sorted_partners:
-            partner_inventory: Optional[PartnerAllocatedInventory] = db.query(PartnerAllocatedInventory).filter(
+            # 차감 대상 판단에는 id / remaining_quantity만 필요
+            partner_inventory: Optional[PartnerAllocatedInventory] = db.query(PartnerAllocatedInventory).options(
+                load_only(PartnerAllocatedInventory.id, PartnerAllocatedInventory.remaining_quantity)
+            ).filter(
                 PartnerAllocatedInventory.partner_id == partner.id,
                 PartnerAllocatedInventory.product_id == product_id,
             ).first()
@@ -179,19 +182,21 @@ class FulfillmentService:
         settings = db.query(Settings).first()
         shipping_commission_rate = Decimal(str(settings.shipping_commission_rate or 0.2)) if settings else Decimal('0.2')
 
+        # 주문 상품별 할당 행을 모아 한 번의 INSERT 로 기록
+        allocation_rows: list[dict] = []
         for order_item in order_items:
             # 배송 커미션 계산: profit_per_item * shipping_commission_rate * quantity
             profit_per_item = Decimal(str(order_item.profit_per_item or 80))
             shipping_commission = profit_per_item * shipping_commission_rate * order_item.quantity
 
-            allocation = ShipmentAllocation(
-                order_id=order.id,
-                order_item_id=order_item.id,
-                partner_id=selected_partner.id,
-                quantity=order_item.quantity,
-                shipping_commission=shipping_commission,
-            )
-            db.add(allocation)
+            allocation_rows.append({
+                "order_id": order.id,
+                "order_item_id": order_item.id,
+                "partner_id": selected_partner.id,
+                "quantity": order_item.quantity,
+                "shipping_commission": shipping_commission,
+            })
+        db.execute(insert(ShipmentAllocation), allocation_rows)
 
         db.commit()
 
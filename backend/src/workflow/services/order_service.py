@@ -85,9 +85,9 @@ class OrderService:
         profit_per_unit = Decimal(str(product.profit_per_unit or 80))
         total_profit = profit_per_unit * quantity
 
-        # 6. 주문 생성
+        # 6. 주문 + 주문 상품 생성 (한 트랜잭션으로 커밋)
         order_number = OrderService.generate_order_number()
-        order = OrderRepository.create_order(
+        order, (order_item,) = OrderRepository.create_order_with_items(
             db,
             order_number=order_number,
             customer_id=customer_id,
@@ -96,16 +96,14 @@ class OrderService:
             total_price=total_price,
             total_profit=total_profit,
             payment_status="pending",
-        )
-
-        # 7. 주문 상품 추가
-        order_item = OrderRepository.add_order_item(
-            db,
-            order_id=order.id,
-            product_id=product_id,
-            quantity=quantity,
-            unit_price=unit_price,
-            profit_per_item=profit_per_unit,
+            items=[
+                {
+                    "product_id": product_id,
+                    "quantity": quantity,
+                    "unit_price": unit_price,
+                    "profit_per_item": profit_per_unit,
+                }
+            ],
         )
 
         return {
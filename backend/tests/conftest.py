@@ -30,6 +30,19 @@ def test_db_engine():
     Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def clear_lookup_caches():
+    """테스트마다 롤백되는 Affiliate/User가 프로세스 캐시에 남지 않도록 비움"""
+    from src.persistence.repositories.affiliate_repository import AffiliateRepository
+    from src.persistence.repositories.user_repository import UserRepository
+
+    AffiliateRepository.invalidate_affiliate_code()
+    UserRepository.invalidate_user()
+    yield
+    AffiliateRepository.invalidate_affiliate_code()
+    UserRepository.invalidate_user()
+
+
 @pytest.fixture(scope="function")
 def test_db(test_db_engine):
     """테스트 데이터베이스 세션"""
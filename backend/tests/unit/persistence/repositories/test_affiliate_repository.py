@@ -39,6 +39,41 @@ class TestGetAffiliateByCode:
         assert result is None
 
 
+class TestGetAffiliateLookupByCode:
+    """Affiliate 코드로 (id, is_active) 캐시 조회"""
+
+    def test_get_affiliate_lookup_by_code_cached(self, test_db: Session, affiliate_active: Affiliate):
+        """Affiliate 코드 캐시 조회 - 두 번째 조회는 DB를 거치지 않음"""
+        # Given
+        test_db.add(affiliate_active)
+        test_db.commit()
+        first = AffiliateRepository.get_affiliate_lookup_by_code(test_db, affiliate_active.code)
+
+        # When: DB 값이 바뀌어도 캐시된 값을 반환
+        affiliate_active.is_active = False
+        test_db.commit()
+        second = AffiliateRepository.get_affiliate_lookup_by_code(test_db, affiliate_active.code)
+
+        # Then
+        assert first == (affiliate_active.id, True)
+        assert second == first
+
+        # When: 무효화 후에는 DB에서 다시 조회
+        AffiliateRepository.invalidate_affiliate_code(affiliate_active.code)
+        third = AffiliateRepository.get_affiliate_lookup_by_code(test_db, affiliate_active.code)
+
+        # Then
+        assert third.is_active is False
+
+    def test_get_affiliate_lookup_by_code_not_found(self, test_db: Session):
+        """Affiliate 코드 캐시 조회 - 존재하지 않는 경우"""
+        # When
+        result = AffiliateRepository.get_affiliate_lookup_by_code(test_db, "aff-invalid-9999")
+
+        # Then
+        assert result is None
+
+
 class TestCreateAffiliateErrorLog:
     """Affiliate Error Log 생성"""
 
@@ -1,6 +1,7 @@
 """낙관적 락으로 재고 차감 - 단위 테스트 (TDD)"""
 
 import pytest
+from sqlalchemy import Update, false
 from sqlalchemy.orm import Session
 from unittest.mock import patch
 
@@ -190,19 +191,27 @@ class TestDecreaseInventoryWithOptimisticLock:
         Given:
         - 초기: remaining_quantity=20, stock_version=0
         - 최대 재시도: 3회
-        - 매 시도마다 다른 스레드가 stock_version을 변경 (지속적 충돌)
+        - 매 시도마다 다른 요청이 먼저 재고를 갱신 (지속적 충돌)
 
         When:
         - 차감 요청 실행
 
         Then:
         - 3회 재시도 후 OptimisticLockFailedError 발생
+        - 데이터베이스 미변경 (remaining_quantity=20, stock_version=0 유지)
         """
         from src.persistence.repositories.inventory_repository import InventoryRepository
 
-        # Given: .update() 메서드를 mock해서 항상 0 (실패)을 반환하도록
-        # 이는 stock_version 불일치로 UPDATE가 0개 행을 반영하는 상황을 시뮬레이션
-        with patch('sqlalchemy.orm.query.Query.update', return_value=0):
+        # Given: 조건부 UPDATE 에만 항상 거짓인 조건을 붙여 0개 행이 갱신되도록 함
+        # (재고는 충분하지만 매번 경쟁에서 지는 상황을 시뮬레이션, 재고 조회는 그대로 실행)
+        execute = test_db.execute
+
+        def execute_losing_every_update(statement, *args, **kwargs):
+            if isinstance(statement, Update):
+                statement = statement.where(false())
+            return execute(statement, *args, **kwargs)
+
+        with patch.object(test_db, "execute", side_effect=execute_losing_every_update):
             # When & Then: 최대 재시도 초과
             with pytest.raises(OrderException) as exc_info:
                 InventoryRepository.decrease_inventory_with_optimistic_lock(
@@ -214,6 +223,11 @@ class TestDecreaseInventoryWithOptimisticLock:
 
             assert exc_info.value.code == "OPTIMISTIC_LOCK_FAILED"
 
+        # DB 미변경 확인
+        test_db.refresh(sample_inventory)
+        assert sample_inventory.remaining_quantity == 20
+        assert sample_inventory.stock_version == 0
+
     # ========== TC-4.2.6: 동시 요청에서 낙관적 락 동시성 보장 ==========
     def test_decrease_inventory_concurrent_simulation(
         self, test_db: Session, sample_inventory
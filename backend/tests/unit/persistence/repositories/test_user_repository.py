@@ -0,0 +1,44 @@
+"""User Repository 테스트"""
+
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+
+from src.persistence.models import User
+from src.persistence.repositories.user_repository import UserRepository
+
+
+class TestGetUserPrincipalById:
+    """사용자 ID로 (id, role) 캐시 조회"""
+
+    def test_get_user_principal_by_id_cached(self, test_db: Session):
+        """사용자 캐시 조회 - 두 번째 조회는 DB를 거치지 않음"""
+        # Given
+        user = User(email="admin@example.com", password_hash="hashed_password", role="admin")
+        test_db.add(user)
+        test_db.commit()
+        first = UserRepository.get_user_principal_by_id(test_db, str(user.id))
+
+        # When: DB 값이 바뀌어도 캐시된 값을 반환
+        user.role = "fulfillment_partner"
+        test_db.commit()
+        second = UserRepository.get_user_principal_by_id(test_db, user.id)
+
+        # Then
+        assert first == (user.id, "admin")
+        assert second == first
+
+        # When: 무효화 후에는 DB에서 다시 조회
+        UserRepository.invalidate_user(user.id)
+        third = UserRepository.get_user_principal_by_id(test_db, user.id)
+
+        # Then
+        assert third.role == "fulfillment_partner"
+
+    def test_get_user_principal_by_id_not_found(self, test_db: Session):
+        """사용자 캐시 조회 - 존재하지 않는 경우"""
+        # When
+        result = UserRepository.get_user_principal_by_id(test_db, uuid4())
+
+        # Then
+        assert result is None